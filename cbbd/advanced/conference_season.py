@@ -79,7 +79,7 @@ class ConferenceSeason:
                     'abbreviation': 'SEC',
                     'short_name': 'SEC'
                 }
-                logger.info(f"Using hardcoded SEC conference info for {season} season")
+                logger.info("Using hardcoded SEC conference info for %s season", season)
         
         if not conference_info:
             raise ValueError(f"Conference '{conference}' not found.")
@@ -90,7 +90,7 @@ class ConferenceSeason:
         else:
             conf_id = conference_info.get('id')
             
-        logger.info(f"Conference ID: {conf_id}")
+        logger.info("Conference ID: %s", conf_id)
         
         # Get the conference abbreviation or name for the API call
         if hasattr(conference_info, 'abbreviation'):
@@ -99,19 +99,19 @@ class ConferenceSeason:
             conf_abbr_or_name = conference_info.get('abbreviation') or conference_info.get('name')
         
         # Get teams directly using the conference parameter
-        logger.info(f"Getting teams for conference '{conf_abbr_or_name}', season {season}")
+        logger.info("Getting teams for conference '%s', season %s", conf_abbr_or_name, season)
         try:
             conference_teams = self.client.teams.get_teams(conference=conf_abbr_or_name, season=season)
-            logger.info(f"Found {len(conference_teams)} teams via direct API call")
+            logger.info("Found %s teams via direct API call", len(conference_teams))
         except Exception as e:
-            logger.error(f"Error getting teams directly: {str(e)}")
+            logger.error("Error getting teams directly: %s", e)
             conference_teams = []
             
         # If we didn't find any teams, try getting all teams and filter by conference ID
         if not conference_teams:
             logger.info("No teams found using direct API, trying to filter all teams")
             all_teams = self.client.teams.get_teams(season=season)
-            logger.info(f"Got {len(all_teams)} total teams, filtering for conference_id={conf_id}")
+            logger.info("Got %s total teams, filtering for conference_id=%s", len(all_teams), conf_id)
             
             # Filter by conference ID or conference string
             conference_teams = []
@@ -126,11 +126,11 @@ class ConferenceSeason:
                     ):
                         conference_teams.append(team)
             
-            logger.info(f"Found {len(conference_teams)} teams after filtering")
+            logger.info("Found %s teams after filtering", len(conference_teams))
                 
         # Special case for SEC in 2024-2025 season
         if season in [2024, 2025] and conference.lower() in ['sec', 'southeastern conference'] and not conference_teams:
-            logger.info(f"Using special case for SEC in {season}")
+            logger.info("Using special case for SEC in %s", season)
             all_teams = self.client.teams.get_teams(season=season)
             
             # Hardcoded list of SEC teams for 2024-2025
@@ -148,10 +148,10 @@ class ConferenceSeason:
         
         # Debug info
         conf_name = getattr(conference_info, 'name', None) or conference_info.get('name')
-        logger.info(f"Found {len(conference_teams)} teams in {conf_name} for {season}")
+        logger.info("Found %s teams in %s for %s", len(conference_teams), conf_name, season)
         
         if not conference_teams:
-            logger.warning(f"No teams found for conference {conference} in season {season}")
+            logger.warning("No teams found for conference %s in season %s", conference, season)
             return {
                 'conference': conference_info.to_dict() if hasattr(conference_info, 'to_dict') else conference_info,
                 'season': season,
@@ -164,14 +164,14 @@ class ConferenceSeason:
         all_games = []
         for team in conference_teams:
             team_name = getattr(team, 'name', None) or getattr(team, 'school', None)
-            logger.info(f"Getting games for team: {team_name}")
+            logger.info("Getting games for team: %s", team_name)
             if team_name:
                 try:
                     team_games = self.client.games.get_games(season=season, team=team_name)
-                    logger.info(f"Found {len(team_games)} games for {team_name}")
+                    logger.info("Found %s games for %s", len(team_games), team_name)
                     all_games.extend(team_games)
                 except Exception as e:
-                    logger.error(f"Error fetching games for {team_name}: {str(e)}")
+                    logger.error("Error fetching games for %s: %s", team_name, e)
 
         # Remove duplicates (same game appears for both home and away team)
         unique_games = {}
@@ -181,14 +181,14 @@ class ConferenceSeason:
                 unique_games[game_id] = game
         
         conference_games = list(unique_games.values())
-        logger.info(f"Found {len(conference_games)} unique games involving conference teams")
+        logger.info("Found %s unique games involving conference teams", len(conference_games))
         
         # Track team records
         team_records = {}
         for team in conference_teams:
             team_name = getattr(team, 'name', None) or getattr(team, 'school', None)
             if not team_name:
-                logger.warning(f"Team missing name attribute: {team}")
+                logger.warning("Team missing name attribute: %s", team)
                 continue
                 
             team_records[team_name] = {
@@ -221,12 +221,12 @@ class ConferenceSeason:
             
             # Skip games with missing data
             if not home_team or not away_team:
-                logger.debug(f"Skipping game with missing team data: {game}")
+                logger.debug("Skipping game with missing team data: %s", game)
                 continue
                 
             # Skip games without scores (future games)
             if home_points is None or away_points is None:
-                logger.debug(f"Skipping game with missing score data: {game}")
+                logger.debug("Skipping game with missing score data: %s", game)
                 continue
                 
             # Check if both teams are conference teams
@@ -358,7 +358,7 @@ class ConferenceSeason:
 
     def _get_mock_data(self, conference_obj, season):
         """Generate mock data for a conference and season"""
-        logger.info(f"Generating mock data for {conference_obj.name}, season {season}")
+        logger.info("Generating mock data for %s, season %s", conference_obj.name, season)
         
         conf_info = conference_obj.to_dict()
         
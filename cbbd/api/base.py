@@ -33,7 +33,7 @@ class BaseAPI:
         """
         self.client = client
         self.logger = get_logger(f"cbbd.api.{self.__class__.__name__.lower()}")
-        self.logger.debug(f"Initializing {self.__class__.__name__}")
+        self.logger.debug("Initializing %s", self.__class__.__name__)
     
     def _request(self, endpoint, params=None):
         """
@@ -58,29 +58,29 @@ class BaseAPI:
             "accept": "application/json"
         }
         
-        self.logger.debug(f"Making request to {endpoint} with params: {params}")
+        self.logger.debug("Making request to %s with params: %s", endpoint, params)
         
         try:
             response = self.client.session.get(url, headers=headers, params=params)
             
             # Handle error responses
             if response.status_code == 401:
-                self.logger.error(f"Authentication failed for {endpoint}")
+                self.logger.error("Authentication failed for %s", endpoint)
                 raise CBBDAuthError("Authentication failed. Check your API key.")
             elif response.status_code == 429:
-                self.logger.error(f"Rate limit exceeded for {endpoint}")
+                self.logger.error("Rate limit exceeded for %s", endpoint)
                 raise CBBDRateLimitError("Rate limit exceeded. Please wait before making more requests.")
             elif response.status_code == 404:
-                self.logger.error(f"Resource not found: {endpoint}")
+                self.logger.error("Resource not found: %s", endpoint)
                 raise CBBDNotFoundError(f"Resource not found: {endpoint}")
             elif response.status_code != 200:
-                self.logger.error(f"API error: {response.status_code} - {response.text}")
+                self.logger.error("API error: %s - %s", response.status_code, response.text)
                 raise CBBDAPIError(f"API error: {response.status_code} - {response.text}")
             
-            self.logger.debug(f"Request to {endpoint} successful")
+            self.logger.debug("Request to %s successful", endpoint)
             return response.json()
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request error for {endpoint}: {str(e)}")
+            self.logger.error("Request error for %s: %s", endpoint, e)
             raise CBBDAPIError(f"Request error: {str(e)}")
 
 def create_http_client():
@@ -33,14 +33,14 @@ class PlayersAPI(BaseAPI):
         Returns:
             A Player object if found, None otherwise.
         """
-        logger.info(f"Getting player with ID {player_id}")
+        logger.info("Getting player with ID %s", player_id)
         try:
             # Define the endpoint path when it's available in the API
             # Currently using a placeholder as this endpoint may not exist yet
             path = f"/players/{player_id}"
             return self._client.make_request(path)
         except Exception as e:
-            logger.error(f"Error getting player: {e}")
+            logger.error("Error getting player: %s", e)
             return None
     
     def search_players(self, name: str = None, team: str = None, season: int = None) -> List[Player]:
@@ -55,7 +55,7 @@ class PlayersAPI(BaseAPI):
         Returns:
             A list of Player objects matching the search criteria.
         """
-        logger.info(f"Searching for players with name={name}, team={team}, season={season}")
+        logger.info("Searching for players with name=%s, team=%s, season=%s", name, team, season)
         try:
             # Define the endpoint path when it's available in the API
             # Currently using a placeholder as this endpoint may not exist yet
@@ -70,5 +70,5 @@ class PlayersAPI(BaseAPI):
                 
             return self._client.make_request(path, params=params) or []
         except Exception as e:
-            logger.error(f"Error searching players: {e}")
+            logger.error("Error searching players: %s", e)
             return []
@@ -46,8 +46,8 @@ class PlaysAPI(BaseAPI):
         import logging
         logger = logging.getLogger(__name__)
         if response and len(response) > 0:
-            logger.info(f"Raw Play API response example (first item): {response[0]}")
-            logger.info(f"Response keys: {response[0].keys() if response and len(response) > 0 and isinstance(response[0], dict) else 'No keys found'}")
+            logger.info("Raw Play API response example (first item): %s", response[0])
+            logger.info("Response keys: %s", response[0].keys() if response and len(response) > 0 and isinstance(response[0], dict) else 'No keys found')
         else:
             logger.info("Empty response from Plays API")
             
@@ -115,8 +115,8 @@ class PlaysAPI(BaseAPI):
         import logging
         logger = logging.getLogger(__name__)
         if response and len(response) > 0:
-            logger.info(f"Raw Play API response example (first item): {response[0]}")
-            logger.info(f"Response keys: {response[0].keys() if response and len(response) > 0 and isinstance(response[0], dict) else 'No keys found'}")
+            logger.info("Raw Play API response example (first item): %s", response[0])
+            logger.info("Response keys: %s", response[0].keys() if response and len(response) > 0 and isinstance(response[0], dict) else 'No keys found')
         else:
             logger.info("Empty response from Plays API")
             
@@ -53,7 +53,7 @@ class RankingsAPI(BaseAPI):
         data = self._request(Endpoints.RANKINGS, params)
         
         # Debug the raw API response
-        logging.info(f"Rankings API response: {data}")
+        logging.info("Rankings API response: %s", data)
         print(f"Raw rankings data: {data}")
         
         # If the response doesn't match the expected structure, adapt it
@@ -35,7 +35,7 @@ class VenuesAPI(BaseAPI):
             path = "/venues"
             return self._client.make_request(path) or []
         except Exception as e:
-            logger.error(f"Error getting venues: {e}")
+            logger.error("Error getting venues: %s", e)
             return []
     
     def get_venue(self, venue_id: int) -> Optional[Venue]:
@@ -48,10 +48,10 @@ class VenuesAPI(BaseAPI):
         Returns:
             A Venue object if found, None otherwise.
         """
-        logger.info(f"Getting venue with ID {venue_id}")
+        logger.info("Getting venue with ID %s", venue_id)
         try:
             path = f"/venues/{venue_id}"
             return self._client.make_request(path)
         except Exception as e:
-            logger.error(f"Error getting venue: {e}")
+            logger.error("Error getting venue: %s", e)
             return None 
\ No newline at end of file
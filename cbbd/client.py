@@ -6,6 +6,7 @@ the College Basketball Data API.
 """
 
 import os
+import hashlib
 import logging
 from typing import Optional, Dict, Any, List, Callable
 from dotenv import load_dotenv
@@ -15,6 +16,7 @@ from urllib3.util.retry import Retry
 
 # Import base components without API modules that might not exist yet
 from .exceptions import CBBDAuthError, CBBDRateLimitError, CBBDNotFoundError
+from .utils.cache import create_cache
 
 # Add the transformers import
 from .transformers import (
@@ -179,7 +181,8 @@ class CBBDClient:
                 cache_ttl: int = 3600,
                 log_level: int = logging.INFO,
                 log_format: Optional[str] = None,
-                log_file: Optional[str] = None):
+                log_file: Optional[str] = None,
+                shared_cache: bool = False):
         """
         Initialize the CBBD client.
         
@@ -191,6 +194,13 @@ class CBBDClient:
             log_level: Logging level
             log_format: Custom log format
             log_file: Path to log file for logging
+            shared_cache: Whether to share one response cache with the other
+                clients in this process using the same base URL and API key.
+                Every sharing client must use the same cache_ttl.
+                
+        Raises:
+            ValueError: If shared_cache is set and cache_ttl differs from the
+                TTL of the already-created shared cache
         """
         # Initialize logging
         self._setup_logging(log_level, log_format, log_file)
@@ -228,10 +238,36 @@ class CBBDClient:
         # Cache settings
         self.use_cache = use_cache
         self.cache_ttl = cache_ttl
-        self.cache = {} if use_cache else None
+        self.cache = self._create_cache(cache_ttl, shared_cache) if use_cache else None
         
         logging.info("CBBD client initialized successfully")
     
+    def _create_cache(self, cache_ttl: int, shared_cache: bool):
+        """
+        Create the response cache, or join the shared one.
+        
+        Shared entries are scoped by the base URL and a SHA-256 digest of
+        the API key, so the key itself is never stored in the cache.
+        
+        Args:
+            cache_ttl: Time to live for cache entries in seconds
+            shared_cache: Whether to use the process-wide shared cache
+            
+        Returns:
+            The cache for this client
+            
+        Raises:
+            ValueError: If cache_ttl conflicts with the shared cache's TTL
+        """
+        key_digest = hashlib.sha256(self.api_key.encode()).hexdigest() if self.api_key else None
+        try:
+            return create_cache(ttl=cache_ttl, shared=shared_cache, scope=(self.base_url, key_digest))
+        except ValueError as e:
+            raise ValueError(
+                f"cache_ttl={cache_ttl} conflicts with the shared cache used by "
+                f"shared_cache=True: {e}"
+            ) from e
+    
     def _import_api_modules(self):
         """Import API modules only when needed to avoid circular imports."""
         if self._imported_api_modules:
@@ -276,7 +312,7 @@ class CBBDClient:
             
             self._imported_api_modules = True
         except ImportError as e:
-            logging.error(f"Error importing API modules: {e}")
+            logging.error("Error importing API modules: %s", e)
             raise
         
     def _setup_logging(self, 
@@ -329,11 +365,13 @@ class CBBDClient:
         if not self.use_cache or not self.cache:
             return {'enabled': False, 'entries': 0, 'size': 0}
             
-        return {
-            'enabled': True,
-            'entries': len(self.cache),
-            'size': sum(len(str(v)) for v in self.cache.values())
-        }
+        # Hold the lock so worker threads cannot change the cache mid-iteration
+        with self.cache.lock:
+            return {
+                'enabled': True,
+                'entries': len(self.cache),
+                'size': sum(len(str(v)) for v in self.cache.values())
+            }
         
     def __getattr__(self, name):
         """
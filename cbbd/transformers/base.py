@@ -33,6 +33,33 @@ class BaseTransformer:
             return None
         return value
     
+    @staticmethod
+    def mask_null_strings(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace "NULL" strings, in any casing, with missing values across a DataFrame.
+        
+        Only object and string columns are scanned since no other dtype can
+        hold strings.
+        
+        Args:
+            df: DataFrame to clean
+            
+        Returns:
+            DataFrame with "NULL" strings replaced by missing values, matched
+            case-insensitively like clean_null_values; df itself is not modified
+        """
+        obj_cols = df.select_dtypes(include=['object', 'string']).columns
+        if len(obj_cols):
+            df = df.copy()
+            for col in obj_cols:
+                try:
+                    is_null = df[col].str.upper().eq('NULL')
+                except AttributeError:
+                    # An object column holding no strings at all
+                    continue
+                df[col] = df[col].mask(is_null)
+        return df
+    
     @staticmethod
     def extract_nested_value(data: Dict, key_path: str, default: Any = None) -> Any:
         """
@@ -82,16 +109,23 @@ class BaseTransformer:
         Returns:
             A flattened dictionary
         """
-        items = []
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            
-            if isinstance(v, dict):
-                items.extend(BaseTransformer.flatten_dict(v, new_key, sep).items())
+        flattened = {}
+        # Walk the nesting with an explicit stack of item iterators so keys
+        # keep the same depth-first order without a recursive call per level
+        stack = [(parent_key, iter(data.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flattened[new_key] = v
             else:
-                items.append((new_key, v))
+                stack.pop()
                 
-        return dict(items)
+        return flattened
     
     @staticmethod
     def safe_convert_to_numeric(df: pd.DataFrame, 
@@ -47,7 +47,7 @@ class PlayersTransformer(BaseTransformer):
                     elif isinstance(item, dict):
                         players_data.append(item)
                     else:
-                        logger.warning(f"Unexpected item type in player data: {type(item)}")
+                        logger.warning("Unexpected item type in player data: %s", type(item))
             elif isinstance(data, Player):
                 players_data.append(self._player_to_dict(data))
             elif hasattr(data, 'players') and data.players:  # For team roster objects
@@ -57,9 +57,9 @@ class PlayersTransformer(BaseTransformer):
                     elif isinstance(player, dict):
                         players_data.append(player)
                     else:
-                        logger.warning(f"Unexpected player type in roster: {type(player)}")
+                        logger.warning("Unexpected player type in roster: %s", type(player))
             else:
-                logger.warning(f"Unsupported data type for player transformation: {type(data)}")
+                logger.warning("Unsupported data type for player transformation: %s", type(data))
                 return pd.DataFrame()
                 
             if not players_data:
@@ -80,7 +80,7 @@ class PlayersTransformer(BaseTransformer):
             return df
             
         except Exception as e:
-            logger.error(f"Error transforming player data to DataFrame: {e}")
+            logger.error("Error transforming player data to DataFrame: %s", e)
             return pd.DataFrame()
             
     def _player_to_dict(self, player: Player) -> Dict:
@@ -147,7 +147,7 @@ class PlayersTransformer(BaseTransformer):
             df = df.drop(columns=['hometown'])
             
         except Exception as e:
-            logger.error(f"Error processing hometown columns: {e}")
+            logger.error("Error processing hometown columns: %s", e)
             
         return df
     
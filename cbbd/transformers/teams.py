@@ -105,52 +105,64 @@ class RosterTransformer(BaseTransformer):
         if not players_data:
             return pd.DataFrame()
             
-        # Process each player into a flattened format
+        # Team info from the roster object is the same for every player
+        team_info = {}
+        if isinstance(raw_data, dict):
+            team_info = {
+                'team': BaseTransformer.extract_nested_value(raw_data, 'team'),
+                'team_id': BaseTransformer.extract_nested_value(raw_data, 'teamId'),
+                'conference': BaseTransformer.extract_nested_value(raw_data, 'conference'),
+                'season': BaseTransformer.extract_nested_value(raw_data, 'season')
+            }
+        
+        # Process each player into a flattened format; "NULL" strings are
+        # masked for all columns at once after the DataFrame is built
         processed_players = []
         for player in players_data:
-            player_dict = {}
-            
-            # Basic player info
-            player_dict['id'] = BaseTransformer.extract_nested_value(player, 'id')
-            player_dict['source_id'] = BaseTransformer.extract_nested_value(player, 'sourceId')
-            player_dict['name'] = BaseTransformer.extract_nested_value(player, 'name')
-            player_dict['first_name'] = BaseTransformer.extract_nested_value(player, 'firstName')
-            player_dict['last_name'] = BaseTransformer.extract_nested_value(player, 'lastName')
-            player_dict['jersey'] = BaseTransformer.extract_nested_value(player, 'jersey')
-            player_dict['position'] = BaseTransformer.extract_nested_value(player, 'position')
-            player_dict['height'] = BaseTransformer.extract_nested_value(player, 'height')
-            player_dict['weight'] = BaseTransformer.extract_nested_value(player, 'weight')
-            player_dict['year'] = BaseTransformer.extract_nested_value(player, 'year')
-            player_dict['start_season'] = BaseTransformer.extract_nested_value(player, 'startSeason')
-            player_dict['end_season'] = BaseTransformer.extract_nested_value(player, 'endSeason')
-            
-            # Extract hometown info
-            hometown = BaseTransformer.extract_nested_value(player, 'hometown', {})
-            player_dict['city'] = BaseTransformer.extract_nested_value(hometown, 'city')
-            player_dict['state'] = BaseTransformer.extract_nested_value(hometown, 'state')
-            player_dict['country'] = BaseTransformer.extract_nested_value(hometown, 'country')
-            player_dict['latitude'] = BaseTransformer.extract_nested_value(hometown, 'latitude')
-            player_dict['longitude'] = BaseTransformer.extract_nested_value(hometown, 'longitude')
-            player_dict['county_fips'] = BaseTransformer.extract_nested_value(hometown, 'countyFips')
+            if not isinstance(player, dict):
+                player = {}
+            hometown = player.get('hometown')
+            if not isinstance(hometown, dict):
+                hometown = {}
             
-            # Alternate sources of hometown data
-            if not player_dict['state'] and BaseTransformer.extract_nested_value(player, 'home_state'):
-                player_dict['state'] = BaseTransformer.extract_nested_value(player, 'home_state')
+            player_dict = {
+                # Basic player info
+                'id': player.get('id'),
+                'source_id': player.get('sourceId'),
+                'name': player.get('name'),
+                'first_name': player.get('firstName'),
+                'last_name': player.get('lastName'),
+                'jersey': player.get('jersey'),
+                'position': player.get('position'),
+                'height': player.get('height'),
+                'weight': player.get('weight'),
+                'year': player.get('year'),
+                'start_season': player.get('startSeason'),
+                'end_season': player.get('endSeason'),
                 
-            if not player_dict['country'] and BaseTransformer.extract_nested_value(player, 'home_country'):
-                player_dict['country'] = BaseTransformer.extract_nested_value(player, 'home_country')
-                
-            # Add team info from the roster object if available
-            if isinstance(raw_data, dict):
-                player_dict['team'] = BaseTransformer.extract_nested_value(raw_data, 'team')
-                player_dict['team_id'] = BaseTransformer.extract_nested_value(raw_data, 'teamId')
-                player_dict['conference'] = BaseTransformer.extract_nested_value(raw_data, 'conference')
-                player_dict['season'] = BaseTransformer.extract_nested_value(raw_data, 'season')
+                # Hometown info
+                'city': hometown.get('city'),
+                'state': hometown.get('state'),
+                'country': hometown.get('country'),
+                'latitude': hometown.get('latitude'),
+                'longitude': hometown.get('longitude'),
+                'county_fips': hometown.get('countyFips'),
                 
+                # Alternate sources of hometown data
+                'home_state': player.get('home_state'),
+                'home_country': player.get('home_country')
+            }
+            player_dict.update(team_info)
             processed_players.append(player_dict)
             
         # Convert to DataFrame
-        df = pd.DataFrame(processed_players)
+        df = BaseTransformer.mask_null_strings(pd.DataFrame(processed_players))
+        
+        # Fall back to the alternate hometown fields where the primary ones are empty
+        for col, alt_col in (('state', 'home_state'), ('country', 'home_country')):
+            alt = df.pop(alt_col)
+            missing = (df[col].isna() | (df[col] == '')) & alt.notna() & (alt != '')
+            df[col] = df[col].mask(missing, alt)
         
         # Calculate experience if start_season is available
         if 'start_season' in df.columns and 'season' in df.columns:
@@ -165,12 +177,12 @@ class RosterTransformer(BaseTransformer):
             state = row.get('state', '')
             country = row.get('country', '')
             
-            # Filter out NULL and empty values
-            if isinstance(city, str) and city.upper() == 'NULL':
+            # Filter out missing values (NULL strings were masked above)
+            if pd.isna(city):
                 city = ''
-            if isinstance(state, str) and state.upper() == 'NULL':
+            if pd.isna(state):
                 state = ''
-            if isinstance(country, str) and country.upper() == 'NULL':
+            if pd.isna(country):
                 country = ''
                 
             # Build the string based on available data
@@ -5,10 +5,15 @@ This module provides helper functions for working with transformed data,
 including visualization preparation and common data operations.
 """
 
+import re
 import pandas as pd
 import numpy as np
 from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 
+# camelCase word boundaries, split in two passes so acronyms stay together
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_TAIL_RE = re.compile('([a-z0-9])([A-Z])')
+
 class DataFrameUtils:
     """Utilities for working with DataFrames in the context of basketball data."""
     
@@ -31,28 +36,30 @@ class DataFrameUtils:
         """
         result = df.copy()
         
-        # Handle numeric columns
-        if numeric_columns:
-            for col in numeric_columns:
-                if col in result.columns:
-                    # Handle 'NULL' string values
-                    result[col] = result[col].replace('NULL', np.nan)
-                    result[col] = pd.to_numeric(result[col], errors='coerce')
+        def present(columns):
+            return [col for col in (columns or []) if col in result.columns]
+        
+        numeric_cols = present(numeric_columns)
+        categorical_cols = present(categorical_columns)
+        date_cols = present(date_columns)
+        
+        # Handle 'NULL' string values in numeric and categorical columns in one pass
+        null_cols = list(dict.fromkeys(numeric_cols + categorical_cols))
+        if null_cols:
+            result[null_cols] = result[null_cols].replace('NULL', np.nan)
         
-        # Handle categorical columns
-        if categorical_columns:
-            for col in categorical_columns:
-                if col in result.columns:
-                    # Remove NULL values before conversion
-                    result[col] = result[col].replace('NULL', np.nan)
-                    # Convert to category
-                    result[col] = result[col].astype('category')
+        # Handle numeric columns; pd.to_numeric only takes 1-D input, so apply
+        # still calls it once per column, but the result is assigned in one go
+        if numeric_cols:
+            result[numeric_cols] = result[numeric_cols].apply(pd.to_numeric, errors='coerce')
         
-        # Handle date columns
-        if date_columns:
-            for col in date_columns:
-                if col in result.columns:
-                    result[col] = pd.to_datetime(result[col], errors='coerce')
+        # Handle categorical columns in a single astype call
+        if categorical_cols:
+            result[categorical_cols] = result[categorical_cols].astype('category')
+        
+        # Handle date columns, again converted per column by apply
+        if date_cols:
+            result[date_cols] = result[date_cols].apply(pd.to_datetime, errors='coerce')
         
         return result
     
@@ -129,14 +136,11 @@ class DataFrameUtils:
         Returns:
             DataFrame with standardized column names
         """
-        # Convert camelCase to snake_case
-        def camel_to_snake(name):
-            import re
-            s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-            return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-        
-        # Create a map of old names to new names
-        col_map = {col: camel_to_snake(col) for col in df.columns}
+        # Create a map of old camelCase names to new snake_case names
+        col_map = {
+            col: _CAMEL_TAIL_RE.sub(r'\1_\2', _CAMEL_WORD_RE.sub(r'\1_\2', col)).lower()
+            for col in df.columns
+        }
         
         # Rename columns
         return df.rename(columns=col_map) 
\ No newline at end of file
@@ -41,11 +41,11 @@ class VenuesTransformer(BaseTransformer):
                     elif isinstance(item, dict):
                         venues_data.append(item)
                     else:
-                        logger.warning(f"Unexpected item type in venue data: {type(item)}")
+                        logger.warning("Unexpected item type in venue data: %s", type(item))
             elif isinstance(data, Venue):
                 venues_data.append(self._venue_to_dict(data))
             else:
-                logger.warning(f"Unsupported data type for venue transformation: {type(data)}")
+                logger.warning("Unsupported data type for venue transformation: %s", type(data))
                 return pd.DataFrame()
                 
             if not venues_data:
@@ -69,7 +69,7 @@ class VenuesTransformer(BaseTransformer):
             return df
             
         except Exception as e:
-            logger.error(f"Error transforming venue data to DataFrame: {e}")
+            logger.error("Error transforming venue data to DataFrame: %s", e)
             return pd.DataFrame()
             
     def _venue_to_dict(self, venue: Venue) -> Dict:
@@ -2,77 +2,300 @@
 Caching utilities for the CFBD Python SDK.
 """
 
-import hashlib
-import json
-from functools import wraps
+import inspect
+import sys
+import threading
+import time
+from collections.abc import MutableMapping
+from functools import update_wrapper, wraps
 from cachetools import TTLCache
 
-def create_cache(maxsize=128, ttl=300):
+# Most records a result may hold, by len(), for cached() to store it
+CACHE_MAX_VALUE_ITEMS = 10000
+
+# Cache behind create_cache(shared=True), created on first use
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+# Source of the wrapper generated for methods with a fixed signature. It has
+# the same flow as the generic wrapper in cached(), but names each argument,
+# so no *args tuple or **kwargs dict is built per call.
+_SPECIALIZED_WRAPPER = """
+def wrapper(self, {params}):
+    _client = self.client
+    if not _client.use_cache:
+        return _func(self, {args})
+    _cache = _client.cache
+    try:
+        _key = (_name, ({args}))
+        return _cache[_key]
+    except KeyError:
+        pass
+    except TypeError:
+        return _func(self, {args})
+    _result = _func(self, {args})
+    if _is_cacheable(_result):
+        _cache[_key] = _result
+    return _result
+"""
+
+class LockedTTLCache(TTLCache):
+    """
+    TTLCache that can be used from several threads at once.
+    
+    Every lookup and store also expires entries and relinks their order, so
+    each operation holds the cache's reentrant lock. Code that iterates over
+    the cache should hold lock for the whole iteration.
+    """
+    
+    def __init__(self, maxsize, ttl, timer=time.monotonic, getsizeof=None):
+        super().__init__(maxsize, ttl, timer, getsizeof)
+        self.lock = threading.RLock()
+    
+    def __getitem__(self, key):
+        with self.lock:
+            return super().__getitem__(key)
+    
+    def __setitem__(self, key, value):
+        with self.lock:
+            super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        with self.lock:
+            super().__delitem__(key)
+    
+    def __contains__(self, key):
+        with self.lock:
+            return super().__contains__(key)
+    
+    def popitem(self):
+        with self.lock:
+            return super().popitem()
+    
+    def expire(self, time=None):
+        with self.lock:
+            return super().expire(time)
+    
+    def clear(self):
+        with self.lock:
+            super().clear()
+
+class SharedCacheView(MutableMapping):
+    """
+    One client's view of the process-wide shared cache.
+    
+    Keys are stored in the shared cache prefixed with the client's scope,
+    so clients for different API URLs or keys never see each other's
+    responses. Length, iteration and clear() only cover this view's entries.
+    """
+    
+    def __init__(self, cache, scope):
+        self.cache = cache
+        self.scope = scope
+    
+    @property
+    def lock(self):
+        """Lock of the shared cache."""
+        return self.cache.lock
+    
+    @property
+    def maxsize(self):
+        """Maximum size of the shared cache."""
+        return self.cache.maxsize
+    
+    @property
+    def ttl(self):
+        """Time-to-live of the shared cache."""
+        return self.cache.ttl
+    
+    def __getitem__(self, key):
+        return self.cache[(self.scope, key)]
+    
+    def __setitem__(self, key, value):
+        self.cache[(self.scope, key)] = value
+    
+    def __delitem__(self, key):
+        del self.cache[(self.scope, key)]
+    
+    def __contains__(self, key):
+        return (self.scope, key) in self.cache
+    
+    def __iter__(self):
+        with self.lock:
+            keys = [key for scope, key in self.cache if scope == self.scope]
+        return iter(keys)
+    
+    def __len__(self):
+        with self.lock:
+            return sum(1 for scope, _ in self.cache if scope == self.scope)
+    
+    def clear(self):
+        with self.lock:
+            for key in list(self):
+                self.cache.pop((self.scope, key), None)
+
+def create_cache(maxsize=128, ttl=300, shared=False, scope=None):
     """
     Create a TTL cache.
     
+    Entries expire against the monotonic clock, so wall-clock adjustments
+    cannot extend or cut short their lifetime. The cache is locked, so
+    cached methods of one client may run in parallel threads.
+    
+    With shared=True the entries live in one module-level cache, so clients
+    with the same scope in the same process reuse each other's responses.
+    
     Args:
         maxsize (int): Maximum cache size
         ttl (int): Time-to-live in seconds
+        shared (bool): Whether to use the process-wide shared cache
+        scope: Hashable key prefix separating clients in the shared cache,
+            such as (base_url, api_key); ignored unless shared
         
     Returns:
-        TTLCache: Cache instance
+        LockedTTLCache, or a SharedCacheView of the shared cache
+        
+    Raises:
+        ValueError: If the shared cache already exists with a different
+            maxsize or ttl
     """
-    return TTLCache(maxsize=maxsize, ttl=ttl)
+    global _shared_cache
+    if not shared:
+        return LockedTTLCache(maxsize=maxsize, ttl=ttl, timer=time.monotonic)
+    
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LockedTTLCache(maxsize=maxsize, ttl=ttl, timer=time.monotonic)
+        elif (_shared_cache.maxsize, _shared_cache.ttl) != (maxsize, ttl):
+            raise ValueError(
+                f"Shared cache already exists with maxsize={_shared_cache.maxsize} "
+                f"and ttl={_shared_cache.ttl}, not maxsize={maxsize} and ttl={ttl}"
+            )
+    return SharedCacheView(_shared_cache, scope)
 
 def generate_cache_key(func_name, args, kwargs):
     """
     Generate a cache key from function name and arguments.
     
+    The key is a plain tuple, like the keys functools.lru_cache builds, so
+    it is hashed directly by the cache instead of being serialized first.
+    
     Args:
         func_name (str): Function name
         args (tuple): Positional arguments
         kwargs (dict): Keyword arguments
         
     Returns:
-        str: Cache key
+        tuple: Cache key, hashable when all arguments are hashable
+        
+    Raises:
+        TypeError: If a keyword argument value is unhashable
     """
-    # Convert args and kwargs to a string representation
-    key_parts = [func_name]
+    if kwargs:
+        # A frozenset ignores keyword order without sorting
+        return (func_name, args, frozenset(kwargs.items()))
     
-    if args:
-        key_parts.append(str(args))
+    return (func_name, args)
+
+def _is_cacheable(value):
+    """
+    Check whether a result is small enough to store in the cache.
     
-    if kwargs:
-        # Sort kwargs by key for consistent ordering
-        sorted_kwargs = sorted(kwargs.items())
-        key_parts.append(str(sorted_kwargs))
+    Results are measured by their number of records, since model lists only
+    hold references and their own size does not grow with the payload.
     
-    # Join parts and create a hash
-    key_str = "_".join(key_parts)
-    return hashlib.md5(key_str.encode()).hexdigest()
+    Args:
+        value: Result returned by a cached method
+        
+    Returns:
+        bool: True if the value has at most CACHE_MAX_VALUE_ITEMS records, or
+        has no length
+    """
+    try:
+        return len(value) <= CACHE_MAX_VALUE_ITEMS
+    except TypeError:
+        return True
+
+def _specialize(func, name):
+    """
+    Generate a caching wrapper for a method with a fixed signature.
+    
+    Every argument, whether passed by position or keyword, is filled in with
+    its default and keyed positionally, so the key matches
+    generate_cache_key(name, args, {}) for the full argument tuple.
+    
+    Args:
+        func: Method to cache, taking self as its first parameter
+        name (str): Cache key prefix for the method
+        
+    Returns:
+        Function wrapper with caching, or None if the signature has *args,
+        **kwargs, keyword-only or positional-only parameters
+    """
+    params = list(inspect.signature(func).parameters.values())[1:]
+    names = []
+    namespace = {'_func': func, '_name': name, '_is_cacheable': _is_cacheable}
+    signature = []
+    for i, param in enumerate(params):
+        if param.kind is not param.POSITIONAL_OR_KEYWORD or param.name.startswith('_'):
+            return None
+        names.append(param.name)
+        if param.default is param.empty:
+            signature.append(param.name)
+        else:
+            namespace[f'_default{i}'] = param.default
+            signature.append(f'{param.name}=_default{i}')
+    
+    args = ''.join(f'{name}, ' for name in names)
+    source = _SPECIALIZED_WRAPPER.format(params=', '.join(signature), args=args)
+    exec(source, namespace)
+    return update_wrapper(namespace['wrapper'], func)
 
 def cached(func):
     """
     Decorator for caching API responses.
     
+    Calls with unhashable arguments are not cached, and neither are results
+    with more than CACHE_MAX_VALUE_ITEMS records. Methods with a fixed
+    signature get a wrapper generated for their parameters; others fall
+    back to a generic *args/**kwargs wrapper.
+    
     Args:
         func: Function to cache
         
     Returns:
         Function wrapper with caching
     """
+    # Qualified so same-named methods of different API classes do not share
+    # entries, and interned so key comparisons can match by identity
+    name = sys.intern(func.__qualname__)
+    
+    wrapper = _specialize(func, name)
+    if wrapper is not None:
+        return wrapper
+    
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        # Skip caching if disabled
-        if not self.client.use_cache:
+        # Skip caching if disabled, before any key is built
+        client = self.client
+        if not client.use_cache:
             return func(self, *args, **kwargs)
         
-        # Generate cache key
-        cache_key = generate_cache_key(func.__name__, args, kwargs)
-        
-        # Check cache
-        if cache_key in self.client.cache:
-            return self.client.cache[cache_key]
+        # Generate cache key and check cache with a single lookup
+        cache = client.cache
+        try:
+            cache_key = generate_cache_key(name, args, kwargs)
+            return cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments cannot be used as a cache key
+            return func(self, *args, **kwargs)
         
         # Make request and cache result
         result = func(self, *args, **kwargs)
-        self.client.cache[cache_key] = result
+        if _is_cacheable(result):
+            cache[cache_key] = result
         return result
     
     return wrapper 
\ No newline at end of file
@@ -1,12 +1,20 @@
 """
 Logging utilities for the CFBD Python SDK.
+
+Log calls in the SDK pass their values as arguments, as in
+logger.debug("Request to %s", endpoint), rather than formatting an f-string.
+The message is then only built when a handler actually emits the record.
 """
 
 import logging
+import logging.handlers
 import os
 import sys
 from typing import Optional, Union, TextIO
 
+# Number of records buffered before they are written to a log file
+FILE_BUFFER_CAPACITY = 1024
+
 
 def setup_logger(
     name: str = "cfbd",
@@ -18,6 +26,10 @@ def setup_logger(
     """
     Set up a logger for the CFBD SDK.
     
+    Records for the log file are buffered and written in batches of
+    FILE_BUFFER_CAPACITY, or as soon as an ERROR is logged. The file itself
+    is only opened when the first batch is written.
+    
     Args:
         name: Logger name
         level: Logging level (default: INFO)
@@ -32,8 +44,8 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Clear existing handlers
-    logger.handlers = []
+    # Index existing handlers by target so repeated setup reuses them
+    existing = {_handler_key(handler): handler for handler in logger.handlers}
     
     # Set default format if not provided
     if log_format is None:
@@ -41,25 +53,84 @@ def setup_logger(
     
     formatter = logging.Formatter(log_format)
     
-    # Add console handler
-    console_handler = logging.StreamHandler(stream)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Console handler, which writes to stderr when no stream is given
+    stream_key = ('stream', sys.stderr if stream is None else stream)
+    handlers = [existing.pop(stream_key, None) or logging.StreamHandler(stream)]
     
-    # Add file handler if log_file is provided
+    # File handler if log_file is provided
     if log_file:
         # Create directory if it doesn't exist
         log_dir = os.path.dirname(log_file)
         if log_dir and not os.path.exists(log_dir):
             os.makedirs(log_dir)
-            
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        file_key = ('file', os.path.abspath(log_file))
+        handlers.append(existing.pop(file_key, None) or _buffered_file_handler(log_file))
+    
+    for handler in handlers:
+        _target(handler).setFormatter(formatter)
+    
+    # Close handlers that are no longer wanted instead of leaking their files
+    for handler in existing.values():
+        target = _target(handler)
+        handler.close()
+        target.close()
+    
+    logger.handlers = handlers
     
     return logger
 
 
+def _buffered_file_handler(log_file: str) -> logging.handlers.MemoryHandler:
+    """
+    Create a handler that buffers records for a log file.
+    
+    Args:
+        log_file: Path to log file
+        
+    Returns:
+        MemoryHandler flushing to a FileHandler opened on first write
+    """
+    return logging.handlers.MemoryHandler(
+        FILE_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=logging.FileHandler(log_file, delay=True)
+    )
+
+
+def _target(handler: logging.Handler) -> logging.Handler:
+    """
+    Get the handler that formats and writes a handler's records.
+    
+    Args:
+        handler: Handler attached to a logger
+        
+    Returns:
+        The target of a buffering handler, otherwise the handler itself
+    """
+    if isinstance(handler, logging.handlers.MemoryHandler) and handler.target is not None:
+        return handler.target
+    return handler
+
+
+def _handler_key(handler: logging.Handler) -> tuple:
+    """
+    Identify a handler by its kind and output target.
+    
+    Args:
+        handler: Handler attached to a logger
+        
+    Returns:
+        Hashable key, equal for handlers writing to the same target
+    """
+    handler = _target(handler)
+    if isinstance(handler, logging.FileHandler):
+        return ('file', handler.baseFilename)
+    if isinstance(handler, logging.StreamHandler):
+        return ('stream', handler.stream)
+    return ('other', id(handler))
+
+
 # Default logger
 logger = setup_logger()
 
@@ -4,6 +4,7 @@ Validation utilities for the CFBD Python SDK.
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from ..exceptions import CBBDValidationError
@@ -11,6 +12,9 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# ISO 8601 format (YYYY-MM-DDTHH:MM:SS with optional offset) or YYYY-MM-DD
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:?\d{2})?)?$')
+
 def validate_required_params(params: Dict[str, Any], required: List[str]) -> None:
     """
     Validate that required parameters are present and not None.
@@ -22,9 +26,10 @@ def validate_required_params(params: Dict[str, Any], required: List[str]) -> Non
     Raises:
         CBBDValidationError: If any required parameters are missing
     """
-    missing = [param for param in required if param not in params or params[param] is None]
+    # A single get() per name covers both absent and None parameters
+    missing = [param for param in required if params.get(param) is None]
     if missing:
-        logger.error(f"Missing required parameters: {missing}")
+        logger.error("Missing required parameters: %s", missing)
         raise CBBDValidationError(f"Missing required parameters: {', '.join(missing)}")
 
 def validate_date(date_str: str) -> None:
@@ -37,20 +42,62 @@ def validate_date(date_str: str) -> None:
     Raises:
         CBBDValidationError: If date format is invalid
     """
-    # ISO 8601 format regex
-    iso_pattern = r'^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:?\d{2})?)?$'
+    if not _parse_date(date_str):
+        logger.error("Invalid date format: %s", date_str)
+        raise CBBDValidationError(f"Invalid date format: {date_str}. Use ISO 8601 format (YYYY-MM-DDTHH:MM:SS) or YYYY-MM-DD.")
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> bool:
+    """
+    Check that a date string matches the date pattern and is a real calendar date.
     
-    # Simple date format (YYYY-MM-DD)
-    date_pattern = r'^\d{4}-\d{2}-\d{2}$'
+    Results are cached, so repeated dates cost a single lookup.
     
-    if not re.match(iso_pattern, date_str) and not re.match(date_pattern, date_str):
-        logger.error(f"Invalid date format: {date_str}")
-        raise CBBDValidationError(f"Invalid date format: {date_str}. Use ISO 8601 format (YYYY-MM-DDTHH:MM:SS) or YYYY-MM-DD.")
+    Args:
+        date_str: Date string to check
+    
+    Returns:
+        bool: True if the date (and time, if present) can be parsed
+    """
+    if not _DATE_RE.match(date_str):
+        return False
+    
+    # The pattern already fixed the layout, so only the calendar fields need
+    # checking; fromisoformat does that in C without strptime's format parsing.
+    # The offset is dropped because fromisoformat only accepts 'Z' from 3.11.
+    try:
+        datetime.fromisoformat(date_str[:19])
+    except ValueError:
+        return False
+    return True
 
 def validate_season(season: Any) -> int:
     """
     Validate season parameter.
     
+    Args:
+        season: Season year (integer or string that can be converted to integer)
+    
+    Returns:
+        int: Validated season as an integer
+    
+    Raises:
+        CBBDValidationError: If season is invalid
+    """
+    try:
+        return _validate_season(season)
+    except TypeError:
+        # Unhashable seasons bypass the cache
+        return _validate_season.__wrapped__(season)
+
+@lru_cache(maxsize=1024)
+def _validate_season(season: Any) -> int:
+    """
+    Validate and convert a season, caching valid results.
+    
+    Invalid seasons raise, so they are never cached. Values int() cannot
+    convert, including None, are reported as invalid seasons.
+    
     Args:
         season: Season year (integer or string that can be converted to integer)
     
@@ -62,11 +109,11 @@ def validate_season(season: Any) -> int:
     """
     try:
         season_int = int(season)
-        
-        if season_int < 1900 or season_int > 2100:
-            logger.error(f"Invalid season range: {season}")
-            raise CBBDValidationError(f"Invalid season: {season}. Season should be a year between 1900 and 2100.")
-        return season_int
-    except ValueError:
-        logger.error(f"Invalid season type: {season}")
-        raise CBBDValidationError(f"Invalid season: {season}. Season should be a year (integer).") 
\ No newline at end of file
+    except (TypeError, ValueError):
+        logger.error("Invalid season type: %s", season)
+        raise CBBDValidationError(f"Invalid season: {season}. Season should be a year (integer).")
+    
+    if not 1900 <= season_int <= 2100:
+        logger.error("Invalid season range: %s", season)
+        raise CBBDValidationError(f"Invalid season: {season}. Season should be a year between 1900 and 2100.")
+    return season_int
\ No newline at end of file
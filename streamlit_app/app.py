@@ -3,16 +3,26 @@ Streamlit app for demonstrating the CBBD Python SDK.
 """
 
 import os
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import streamlit as st
 import pandas as pd
 import altair as alt
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 from dotenv import load_dotenv
 import numpy as np
 
 from cbbd import CBBDClient
+from frames import (
+    LINE_COLUMNS,
+    PLAY_COLUMNS,
+    PLAY_FALLBACK_KEYS,
+    SRS_COLUMNS,
+    TEAM_PLAY_COLUMNS,
+    records_frame,
+)
 
 # Load environment variables
 load_dotenv()
@@ -22,6 +32,240 @@ DEFAULT_SEASON = 2023
 DEFAULT_TEAM = "Duke"
 DEFAULT_CONFERENCE = "ACC"
 
+# Low-cardinality label columns shown as categoricals in st.dataframe
+CATEGORY_COLUMNS = ("Team", "Conference", "Provider", "Play Type", "Position")
+
+
+@st.cache_data(show_spinner=False)
+def _experience_by_position(team, season, roster_hash, _exp_df):
+    """
+    Average experience per position for a roster.
+
+    Cached on team, season and a hash of the roster contents; the frame itself
+    is excluded from Streamlit's argument hashing.
+    """
+    return (
+        _exp_df.groupby("Position", observed=True)["Experience"]
+        .mean()
+        .reset_index(name="Avg Experience")
+    )
+
+
+def _arrow_dtypes(df):
+    """
+    Cast display columns to dtypes Streamlit can hand to Arrow without copying.
+
+    Args:
+        df: DataFrame about to be shown with st.dataframe
+
+    Returns:
+        DataFrame with low-cardinality label columns as ``category`` and free
+        text as ``string[pyarrow]``
+    """
+    dtypes = {col: "category" for col in CATEGORY_COLUMNS if col in df.columns}
+    if "Description" in df.columns:
+        dtypes["Description"] = "string[pyarrow]"
+    return df.astype(dtypes)
+
+
+def _show_exc(message):
+    """
+    Report an error on the page, with a short traceback when debugging is on.
+
+    Must be called from inside an ``except`` block.
+
+    Args:
+        message: Error message to display
+    """
+    st.error(message)
+    if st.session_state.get("debug"):
+        st.code(traceback.format_exc(limit=5))
+
+
+def _raw(obj):
+    """
+    Get the raw API payload behind an SDK model object.
+
+    Args:
+        obj: SDK model object
+
+    Returns:
+        The model's raw data dict, or an empty dict if it has none
+    """
+    get_raw_data = getattr(type(obj), 'get_raw_data', None)
+    if get_raw_data is not None:
+        return get_raw_data(obj)
+    return getattr(obj, '_data', None) or {}
+
+
+# Worker clients kept for _parallel, so no two threads share a requests Session
+PARALLEL_WORKERS = 8
+
+
+@st.cache_resource(show_spinner=False)
+def _worker_clients(api_key):
+    """
+    Build the pool of clients used by _parallel, once per API key.
+
+    Args:
+        api_key: API key for the worker clients
+
+    Returns:
+        Queue of PARALLEL_WORKERS clients, each with its own requests Session
+    """
+    workers = queue.SimpleQueue()
+    for _ in range(PARALLEL_WORKERS):
+        workers.put(CBBDClient(api_key=api_key, use_cache=False))
+    return workers
+
+
+def _parallel(client, *calls):
+    """
+    Run independent API calls concurrently.
+
+    requests.Session is not thread-safe, so each call runs on a worker
+    client of its own. The workers use ``client``'s response cache, which is
+    locked for concurrent use.
+
+    Args:
+        client: Client whose API key and cache the calls use
+        *calls: Callables taking a client, each typically making one API request
+
+    Returns:
+        List of results in the same order as ``calls``. An exception raised by
+        any call is re-raised here.
+    """
+    workers = _worker_clients(client.api_key)
+
+    def run(call):
+        worker = workers.get()
+        try:
+            worker.use_cache, worker.cache = client.use_cache, client.cache
+            return call(worker)
+        finally:
+            workers.put(worker)
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), PARALLEL_WORKERS)) as executor:
+        futures = [executor.submit(run, call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def _preview(obj, max_items=10):
+    """
+    Trim a raw API payload for the "Raw Data Sample" expanders.
+
+    Args:
+        obj: Raw data (dicts, lists and scalars)
+        max_items: Maximum number of items kept from each list
+
+    Returns:
+        A copy of ``obj`` with every nested list cut to ``max_items`` entries
+    """
+    if isinstance(obj, dict):
+        return {key: _preview(value, max_items) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_preview(item, max_items) for item in obj[:max_items]]
+    return obj
+
+
+# Chart specs only depend on their labels, so they are built once per set of
+# labels and rendered against the current DataFrame with st.vega_lite_chart.
+def _spec(chart):
+    """Convert a data-less Altair chart into a Vega-Lite spec dict."""
+    spec = chart.to_dict()
+    spec.pop("data", None)
+    spec.pop("datasets", None)
+    return spec
+
+
+@st.cache_data(show_spinner=False)
+def _rankings_chart_spec(title):
+    return _spec(alt.Chart().mark_bar().encode(
+        y=alt.Y("Team:N", sort="x"),
+        x=alt.X("Rank:Q", scale=alt.Scale(reverse=True)),
+        color=alt.Color("Conference:N"),
+        tooltip=["Rank:Q", "Team:N", "Conference:N", "Points:Q", "First Place Votes:Q"]
+    ).properties(
+        title=title,
+        width=600,
+        height=500
+    ))
+
+
+@st.cache_data(show_spinner=False)
+def _srs_chart_spec(title):
+    return _spec(alt.Chart().mark_bar().encode(
+        y=alt.Y("Team:N", sort="-x"),
+        x=alt.X("Rating:Q"),
+        color=alt.Color("Conference:N"),
+        tooltip=["Team:N", "Conference:N", "Rating:Q"]
+    ).properties(
+        title=title,
+        width=600,
+        height=500
+    ))
+
+
+@st.cache_data(show_spinner=False)
+def _efficiency_chart_spec(title):
+    return _spec(alt.Chart().mark_circle(size=60).encode(
+        x=alt.X("Offensive Rating:Q", title="Offensive Rating"),
+        y=alt.Y("Defensive Rating:Q", title="Defensive Rating", scale=alt.Scale(reverse=True)),
+        color=alt.Color("Conference:N"),
+        tooltip=["Team:N", "Conference:N", "Offensive Rating:Q", "Defensive Rating:Q", "Net Rating:Q"]
+    ).properties(
+        title=title,
+        width=600,
+        height=500
+    ))
+
+
+@st.cache_data(show_spinner=False)
+def _play_type_chart_spec(key, title):
+    return _spec(alt.Chart().mark_bar().encode(
+        y=alt.Y(f"{key}:N", sort="-x"),
+        x=alt.X("Count:Q"),
+        tooltip=[f"{key}:N", "Count:Q"]
+    ).properties(
+        title=title,
+        width=600,
+        height=400
+    ))
+
+
+@st.cache_data(show_spinner=False)
+def _histogram_spec(field, title):
+    # Bins arrive pre-computed from _bin_counts, in ascending order
+    return _spec(alt.Chart().mark_bar().encode(
+        x=alt.X(f"{field}:O", sort=None),
+        y=alt.Y("Count:Q"),
+        tooltip=[f"{field}:O", "Count:Q"]
+    ).properties(
+        title=title,
+        width=600,
+        height=300
+    ))
+
+
+def _bin_counts(series, bins=20):
+    """
+    Bin a numeric column in pandas so charts receive counts instead of raw rows.
+
+    Args:
+        series: Named numeric Series to bin
+        bins: Number of equal-width bins
+
+    Returns:
+        DataFrame with the bin label (as a string, in ascending order) under
+        the series name and its row count under "Count"
+    """
+    values = pd.to_numeric(series, errors="coerce").dropna()
+    if values.empty:
+        return pd.DataFrame({series.name: [], "Count": []})
+    counts = values.groupby(pd.cut(values, bins=bins), observed=True).size().reset_index(name="Count")
+    counts[series.name] = counts[series.name].astype(str)
+    return counts
+
 # Configure the page
 st.set_page_config(
     page_title="CBBD Python SDK Demo",
@@ -118,10 +362,12 @@ teams = []
 conferences = []
 if client:
     try:
-        teams_data = client.teams.get_teams()
+        teams_data, conferences_data = _parallel(
+            client,
+            lambda worker: worker.teams.get_teams(),
+            lambda worker: worker.conferences.get_conferences()
+        )
         teams = sorted([team.name for team in teams_data])
-        
-        conferences_data = client.conferences.get_conferences()
         conferences = sorted([conf.abbreviation for conf in conferences_data])
     except Exception as e:
         st.sidebar.error(f"Error loading teams/conferences: {e}")
@@ -138,6 +384,10 @@ conference = st.sidebar.selectbox(
     index=0 if DEFAULT_CONFERENCE in conferences else 0
 ) if page != "Conferences" else None
 
+# Sidebar - Debugging
+st.sidebar.markdown("### Debugging")
+st.sidebar.checkbox("Show error tracebacks", value=False, key="debug")
+
 # Main content
 if page == "Home":
     st.markdown('<div class="main-header">CBBD Python SDK Demo</div>', unsafe_allow_html=True)
@@ -434,9 +684,7 @@ elif page == "Teams" and client:
                                 
                                 roster_data.append(player_data)
                     except Exception as e:
-                        st.error(f"Error extracting player data: {e}")
-                        import traceback
-                        st.text(traceback.format_exc())
+                        _show_exc(f"Error extracting player data: {e}")
                         roster_data = []
                     
                     # Convert to DataFrame
@@ -663,30 +911,32 @@ elif page == "Teams" and client:
                             
                             if len(pos_counts) > 1:  # Only create chart if we have multiple positions
                                 # Pie chart for positions
-                                position_fig, ax = plt.subplots(figsize=(8, 8))
-                                ax.pie(pos_counts["Count"], labels=pos_counts["Position"], autopct='%1.1f%%', 
-                                      startangle=90, shadow=False)
-                                ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
-                                plt.title(f"Position Breakdown for {team} ({season})")
-                                st.pyplot(position_fig)
+                                position_chart = alt.Chart(pos_counts).mark_arc(innerRadius=0).encode(
+                                    theta=alt.Theta("Count:Q"),
+                                    color=alt.Color("Position:N", scale=alt.Scale(scheme="category10")),
+                                    tooltip=["Position", "Count"]
+                                ).properties(
+                                    title=f"Position Breakdown for {team} ({season})",
+                                    width=400,
+                                    height=400
+                                )
+                                
+                                st.altair_chart(position_chart, use_container_width=True)
                             
-                            # Table of players by position
+                            # Table of players by position, rendered as a single markdown block
                             st.subheader("Players by Position")
-                            for position in pos_counts["Position"]:
-                                position_players = roster_df[roster_df["Position"] == position]
-                                st.markdown(f"**{position}** ({len(position_players)}): " + 
-                                            ", ".join(position_players["Name"].tolist()))
-
-                            # Position breakdown
-                            for position in sorted(roster_df["Position"].unique()):
-                                position_players = roster_df[roster_df["Position"] == position].sort_values("Jersey")
-                                st.markdown(f"**{position}** ({len(position_players)}): " + 
-                                        ", ".join(position_players["Name"].tolist()))
+                            position_lines = []
+                            for position, position_players in roster_df.sort_values("Jersey").groupby("Position", sort=True):
+                                position_lines.append(f"**{position}** ({len(position_players)}): " + 
+                                                      ", ".join(position_players["Name"]))
+                            st.markdown("\n\n".join(position_lines))
                             
                             # Position experience breakdown - only if we have experience data
                             if "Experience" in roster_df.columns and not roster_df["Experience"].isna().all():
-                                exp_by_pos = roster_df.groupby("Position")["Experience"].mean().reset_index()
-                                exp_by_pos.columns = ["Position", "Avg Experience"]
+                                exp_df = roster_df[["Position", "Experience"]].astype({"Position": "category"})
+                                exp_df["Experience"] = pd.to_numeric(exp_df["Experience"], downcast="float")
+                                roster_hash = int(pd.util.hash_pandas_object(exp_df, index=False).sum())
+                                exp_by_pos = _experience_by_position(team, season, roster_hash, exp_df)
                                 
                                 if len(exp_by_pos) > 1:  # Only create chart if we have multiple positions
                                     exp_chart = alt.Chart(exp_by_pos).mark_bar().encode(
@@ -706,9 +956,7 @@ elif page == "Teams" and client:
                         else:
                             st.warning(f"No roster data found for {team} in {season}.")
         except Exception as e:
-            st.error(f"Error loading roster data: {e}")
-            import traceback
-            st.text(traceback.format_exc())
+            _show_exc(f"Error loading roster data: {e}")
 
 elif page == "Games" and client:
     st.markdown('<div class="main-header">Games</div>', unsafe_allow_html=True)
@@ -749,12 +997,17 @@ elif page == "Games" and client:
                 
                 st.dataframe(games_df)
                 
-                # Calculate and display wins and losses
-                wins = len(games_df[(games_df["Home Team"] == team) & (games_df["Home Winner"] == True)]) + \
-                       len(games_df[(games_df["Away Team"] == team) & (games_df["Away Winner"] == True)])
+                # Calculate and display wins and losses, counting mask hits
+                # rather than materializing the filtered rows
+                is_home = (games_df["Home Team"] == team).to_numpy()
+                is_away = (games_df["Away Team"] == team).to_numpy()
+                home_won = (games_df["Home Winner"] == True).to_numpy()
+                home_lost = (games_df["Home Winner"] == False).to_numpy()
+                away_won = (games_df["Away Winner"] == True).to_numpy()
+                away_lost = (games_df["Away Winner"] == False).to_numpy()
                 
-                losses = len(games_df[(games_df["Home Team"] == team) & (games_df["Home Winner"] == False)]) + \
-                         len(games_df[(games_df["Away Team"] == team) & (games_df["Away Winner"] == False)])
+                wins = int(np.count_nonzero(is_home & home_won)) + int(np.count_nonzero(is_away & away_won))
+                losses = int(np.count_nonzero(is_home & home_lost)) + int(np.count_nonzero(is_away & away_lost))
                 
                 col1, col2 = st.columns(2)
                 
@@ -769,15 +1022,14 @@ elif page == "Games" and client:
                 opponent_points = []
                 dates = []
                 
-                for _, game in games_df.iterrows():
-                    date = game["Date"]
-                    
-                    if game["Home Team"] == team:
-                        team_points.append(game["Home Score"])
-                        opponent_points.append(game["Away Score"])
+                game_rows = games_df[["Date", "Home Team", "Home Score", "Away Score"]].itertuples(index=False, name=None)
+                for date, home_team, home_score, away_score in game_rows:
+                    if home_team == team:
+                        team_points.append(home_score)
+                        opponent_points.append(away_score)
                     else:
-                        team_points.append(game["Away Score"])
-                        opponent_points.append(game["Home Score"])
+                        team_points.append(away_score)
+                        opponent_points.append(home_score)
                     
                     dates.append(date)
                 
@@ -1776,13 +2028,14 @@ if not ap_rankings.empty:
                         team_ml = []
                         opponent_ml = []
                         
-                        for _, row in lines_df.iterrows():
-                            if row['home_team'] == lines_team:
-                                team_ml.append(row['home_moneyline'])
-                                opponent_ml.append(row['away_moneyline'])
+                        line_rows = lines_df[['home_team', 'home_moneyline', 'away_moneyline']].itertuples(index=False, name=None)
+                        for home_team, home_ml, away_ml in line_rows:
+                            if home_team == lines_team:
+                                team_ml.append(home_ml)
+                                opponent_ml.append(away_ml)
                             else:
-                                team_ml.append(row['away_moneyline'])
-                                opponent_ml.append(row['home_moneyline'])
+                                team_ml.append(away_ml)
+                                opponent_ml.append(home_ml)
                         
                         # Add to DataFrame
                         ml_df = pd.DataFrame({
@@ -2288,17 +2541,20 @@ elif page == "Rankings" and client:
         st.write("Checking for available rankings data across seasons...")
         available_data = {}
         
-        # Check a few seasons and weeks
-        for s in [2022, 2023, 2024]:
-            available_data[s] = {}
-            for w in [1, 5, 10, 15]:
-                try:
-                    with st.spinner(f"Checking season {s}, week {w}..."):
-                        data = client.rankings.get_rankings(season=s, week=w, poll_type=poll_type)
-                        has_data = len(data) > 0 and any(len(r.polls) > 0 for r in data)
-                        available_data[s][w] = "✅" if has_data else "❌"
-                except Exception as e:
-                    available_data[s][w] = f"❌ (Error: {str(e)})"
+        def check_rankings(s, w, worker):
+            try:
+                data = worker.rankings.get_rankings(season=s, week=w, poll_type=poll_type)
+                has_data = len(data) > 0 and any(len(r.polls) > 0 for r in data)
+                return "✅" if has_data else "❌"
+            except Exception as e:
+                return f"❌ (Error: {str(e)})"
+        
+        # Check a few seasons and weeks, all requests in flight at once
+        checks = [(s, w) for s in [2022, 2023, 2024] for w in [1, 5, 10, 15]]
+        with st.spinner("Checking seasons 2022-2024..."):
+            results = _parallel(client, *(partial(check_rankings, s, w) for s, w in checks))
+        for (s, w), result in zip(checks, results):
+            available_data.setdefault(s, {})[w] = result
         
         # Display results
         results_df = pd.DataFrame(available_data)
@@ -2318,26 +2574,13 @@ elif page == "Rankings" and client:
                 # Show a sample of the raw data in expandable section
                 with st.expander("Raw Data Sample"):
                     if len(rankings_data) > 0:
-                        if hasattr(rankings_data[0], 'get_raw_data'):
-                            st.json(rankings_data[0].get_raw_data())
-                        else:
-                            # If get_raw_data is not available, try to get the dictionary representation
-                            try:
-                                st.json(rankings_data[0].__dict__.get('_data', {}))
-                            except:
-                                st.write("Raw data not available")
+                        st.json(_preview(_raw(rankings_data[0])), expanded=False)
                         
                         # Also show a sample poll if available
                         if hasattr(rankings_data[0], 'polls') and len(rankings_data[0].polls) > 0:
                             st.subheader("Sample Poll Data")
                             poll = rankings_data[0].polls[0]
-                            if hasattr(poll, 'get_raw_data'):
-                                st.json(poll.get_raw_data())
-                            else:
-                                try:
-                                    st.json(poll.__dict__.get('_data', {}))
-                                except:
-                                    st.write("Raw poll data not available")
+                            st.json(_preview(_raw(poll)), expanded=False)
                 
                 # Debug information
                 st.text(f"API Response Type: {type(rankings_data)}")
@@ -2386,32 +2629,20 @@ elif page == "Rankings" and client:
                 if all_ranks:
                     # Convert to DataFrame for better display
                     rankings_df = pd.DataFrame(all_ranks)
-                    st.dataframe(rankings_df)
+                    rankings_df = _arrow_dtypes(rankings_df)
+                    st.dataframe(rankings_df, use_container_width=True, hide_index=True)
                     
                     # Visualization of top 25
                     top25 = rankings_df.nsmallest(25, "Rank")
                     
-                    chart = alt.Chart(top25).mark_bar().encode(
-                        y=alt.Y("Team:N", sort="x"),
-                        x=alt.X("Rank:Q", scale=alt.Scale(reverse=True)),
-                        color=alt.Color("Conference:N"),
-                        tooltip=["Rank", "Team", "Conference", "Points", "First Place Votes"]
-                    ).properties(
-                        title=f"{poll_type.upper()} Poll - Week {week}, Season {rankings_season}",
-                        width=600,
-                        height=500
-                    )
-                    
-                    st.altair_chart(chart, use_container_width=True)
+                    spec = _rankings_chart_spec(f"{poll_type.upper()} Poll - Week {week}, Season {rankings_season}")
+                    st.vega_lite_chart(top25, spec, use_container_width=True)
                 else:
                     st.warning(f"No rankings found for poll type {poll_type} in week {week} of season {rankings_season}.")
             else:
                 st.warning(f"No rankings data found for season {rankings_season}, week {week}.")
     except Exception as e:
-        st.error(f"Error loading rankings data: {e}")
-        # Print the full exception traceback
-        import traceback
-        st.text(traceback.format_exc())
+        _show_exc(f"Error loading rankings data: {e}")
 
 elif page == "Ratings" and client:
     st.markdown('<div class="main-header">Ratings</div>', unsafe_allow_html=True)
@@ -2432,39 +2663,25 @@ elif page == "Ratings" and client:
                     # Show a sample of the raw data in expandable section
                     with st.expander("Raw Data Sample"):
                         if len(ratings_data) > 0:
-                            if hasattr(ratings_data[0], 'get_raw_data'):
-                                st.json(ratings_data[0].get_raw_data())
-                            else:
-                                # If get_raw_data is not available, try to get the dictionary representation
-                                try:
-                                    st.json(ratings_data[0].__dict__.get('_data', {}))
-                                except:
-                                    st.write("Raw data not available")
+                            st.json(_preview(_raw(ratings_data[0])), expanded=False)
                     
                     # Convert to DataFrame for better display
-                    ratings_df = pd.DataFrame([
-                        {
-                            "Team": rating.team,
-                            "Conference": rating.conference,
-                            "Rating": rating.rating
-                        } for rating in ratings_data
-                    ])
+                    ratings_df = records_frame(ratings_data, SRS_COLUMNS)
+                    if ratings_df is None:
+                        ratings_df = pd.DataFrame([
+                            {
+                                "Team": rating.team,
+                                "Conference": rating.conference,
+                                "Rating": rating.rating
+                            } for rating in ratings_data
+                        ])
                     
-                    st.dataframe(ratings_df)
+                    ratings_df = _arrow_dtypes(ratings_df)
+                    st.dataframe(ratings_df, use_container_width=True, hide_index=True)
                     
                     # Visualization
-                    chart = alt.Chart(ratings_df).mark_bar().encode(
-                        y=alt.Y("Team:N", sort="-x"),
-                        x=alt.X("Rating:Q"),
-                        color=alt.Color("Conference:N"),
-                        tooltip=["Team", "Conference", "Rating"]
-                    ).properties(
-                        title=f"SRS Ratings - Season {season}",
-                        width=600,
-                        height=500
-                    )
-                    
-                    st.altair_chart(chart, use_container_width=True)
+                    spec = _srs_chart_spec(f"SRS Ratings - Season {season}")
+                    st.vega_lite_chart(ratings_df, spec, use_container_width=True)
                 else:
                     st.warning(f"No SRS ratings data found for season {season}.")
             
@@ -2479,14 +2696,7 @@ elif page == "Ratings" and client:
                     # Show a sample of the raw data in expandable section
                     with st.expander("Raw Data Sample"):
                         if len(ratings_data) > 0:
-                            if hasattr(ratings_data[0], 'get_raw_data'):
-                                st.json(ratings_data[0].get_raw_data())
-                            else:
-                                # If get_raw_data is not available, try to get the dictionary representation
-                                try:
-                                    st.json(ratings_data[0].__dict__.get('_data', {}))
-                                except:
-                                    st.write("Raw data not available")
+                            st.json(_preview(_raw(ratings_data[0])), expanded=False)
                     
                     # Convert to DataFrame for better display
                     ratings_df = pd.DataFrame([
@@ -2499,21 +2709,12 @@ elif page == "Ratings" and client:
                         } for rating in ratings_data
                     ])
                     
-                    st.dataframe(ratings_df)
+                    ratings_df = _arrow_dtypes(ratings_df)
+                    st.dataframe(ratings_df, use_container_width=True, hide_index=True)
                     
                     # Visualization
-                    chart = alt.Chart(ratings_df).mark_circle(size=60).encode(
-                        x=alt.X("Offensive Rating:Q", title="Offensive Rating"),
-                        y=alt.Y("Defensive Rating:Q", title="Defensive Rating", scale=alt.Scale(reverse=True)),
-                        color=alt.Color("Conference:N"),
-                        tooltip=["Team", "Conference", "Offensive Rating", "Defensive Rating", "Net Rating"]
-                    ).properties(
-                        title=f"Adjusted Efficiency Ratings - Season {season}",
-                        width=600,
-                        height=500
-                    )
-                    
-                    st.altair_chart(chart, use_container_width=True)
+                    spec = _efficiency_chart_spec(f"Adjusted Efficiency Ratings - Season {season}")
+                    st.vega_lite_chart(ratings_df, spec, use_container_width=True)
                 else:
                     st.warning(f"No adjusted efficiency ratings data found for season {season}.")
             
@@ -2543,57 +2744,50 @@ elif page == "Plays" and client:
                     if plays_data and len(plays_data) > 0:
                         # Show a sample of the raw data in expandable section
                         with st.expander("Raw Data Sample"):
-                            if hasattr(plays_data[0], 'get_raw_data'):
-                                st.json(plays_data[0].get_raw_data())
-                            else:
-                                st.write("Raw data method not available")
+                            st.json(_preview(_raw(plays_data[0])), expanded=False)
                         
                         # Convert to DataFrame for better display
-                        plays_df = pd.DataFrame([
-                            {
-                                "Game ID": play.game_id,
-                                "Period": play.period,
-                                "Clock": play.clock,
-                                "Team": play.team,
-                                "Player": play.player,
-                                "Play Type": play.play_type,
-                                "Home Score": play.home_score,
-                                "Away Score": play.away_score,
-                                "Description": play.play_text or play.description
-                            } for play in plays_data
-                        ])
+                        plays_df = records_frame(plays_data, PLAY_COLUMNS, PLAY_FALLBACK_KEYS)
+                        if plays_df is not None:
+                            # Player and Description fall back across several raw keys
+                            plays_df["Player"] = [play.player for play in plays_data]
+                            plays_df["Description"] = [play.play_text or play.description for play in plays_data]
+                        else:
+                            plays_df = pd.DataFrame([
+                                {
+                                    "Game ID": play.game_id,
+                                    "Period": play.period,
+                                    "Clock": play.clock,
+                                    "Team": play.team,
+                                    "Player": play.player,
+                                    "Play Type": play.play_type,
+                                    "Home Score": play.home_score,
+                                    "Away Score": play.away_score,
+                                    "Description": play.play_text or play.description
+                                } for play in plays_data
+                            ])
                         
                         # Remove columns that are all None
                         for col in plays_df.columns:
                             if plays_df[col].isna().all() or (plays_df[col] == 'None').all():
                                 plays_df = plays_df.drop(col, axis=1)
                         
-                        st.dataframe(plays_df)
+                        plays_df = _arrow_dtypes(plays_df)
+                        st.dataframe(plays_df, use_container_width=True, hide_index=True)
                         
                         # Play type distribution - check if we have data for this
                         key_for_chart = next((col for col in ["Play Type", "event_type"] if col in plays_df.columns), None)
                         
                         if key_for_chart and not plays_df[key_for_chart].isna().all() and not (plays_df[key_for_chart] == 'None').all():
-                            play_type_counts = plays_df[key_for_chart].value_counts().reset_index()
-                            play_type_counts.columns = [key_for_chart, "Count"]
+                            plays_df[key_for_chart] = plays_df[key_for_chart].astype("category")
+                            play_type_counts = plays_df.groupby(key_for_chart, observed=True, sort=False).size().reset_index(name="Count")
                             
-                            chart = alt.Chart(play_type_counts).mark_bar().encode(
-                                y=alt.Y(f"{key_for_chart}:N", sort="-x"),
-                                x=alt.X("Count:Q"),
-                                tooltip=[key_for_chart, "Count"]
-                            ).properties(
-                                title=f"Play Type Distribution - Game ID {game_id}",
-                                width=600,
-                                height=400
-                            )
-                            
-                            st.altair_chart(chart, use_container_width=True)
+                            spec = _play_type_chart_spec(key_for_chart, f"Play Type Distribution - Game ID {game_id}")
+                            st.vega_lite_chart(play_type_counts, spec, use_container_width=True)
                     else:
                         st.warning(f"No plays data found for game ID {game_id}.")
             except Exception as e:
-                st.error(f"Error loading plays data: {e}")
-                import traceback
-                st.text(traceback.format_exc())
+                _show_exc(f"Error loading plays data: {e}")
     
     with tab2:
         # Option to filter by shooting plays only
@@ -2610,59 +2804,52 @@ elif page == "Plays" and client:
                 if plays_data and len(plays_data) > 0:
                     # Show a sample of the raw data in expandable section
                     with st.expander("Raw Data Sample"):
-                        if hasattr(plays_data[0], 'get_raw_data'):
-                            st.json(plays_data[0].get_raw_data())
-                        else:
-                            st.write("Raw data method not available")
+                        st.json(_preview(_raw(plays_data[0])), expanded=False)
                     
                     # Convert to DataFrame for better display
-                    plays_df = pd.DataFrame([
-                        {
-                            "Game ID": play.game_id,
-                            "Period": play.period,
-                            "Clock": play.clock,
-                            "Team": play.team,
-                            "Player": play.player,
-                            "Play Type": play.play_type,
-                            "Home Score": play.home_score,
-                            "Away Score": play.away_score,
-                            "Description": play.play_text or play.description,
-                            "Scoring Play": play.scoring_play,
-                            "Shooting Play": play.shooting_play
-                        } for play in plays_data
-                    ])
+                    plays_df = records_frame(plays_data, TEAM_PLAY_COLUMNS, PLAY_FALLBACK_KEYS)
+                    if plays_df is not None:
+                        # Player and Description fall back across several raw keys
+                        plays_df["Player"] = [play.player for play in plays_data]
+                        plays_df["Description"] = [play.play_text or play.description for play in plays_data]
+                    else:
+                        plays_df = pd.DataFrame([
+                            {
+                                "Game ID": play.game_id,
+                                "Period": play.period,
+                                "Clock": play.clock,
+                                "Team": play.team,
+                                "Player": play.player,
+                                "Play Type": play.play_type,
+                                "Home Score": play.home_score,
+                                "Away Score": play.away_score,
+                                "Description": play.play_text or play.description,
+                                "Scoring Play": play.scoring_play,
+                                "Shooting Play": play.shooting_play
+                            } for play in plays_data
+                        ])
                     
                     # Remove columns that are all None
                     for col in plays_df.columns:
                         if plays_df[col].isna().all() or (plays_df[col] == 'None').all():
                             plays_df = plays_df.drop(col, axis=1)
                     
-                    st.dataframe(plays_df)
+                    plays_df = _arrow_dtypes(plays_df)
+                    st.dataframe(plays_df, use_container_width=True, hide_index=True)
                     
                     # Play type distribution - check if we have data for this
                     key_for_chart = next((col for col in ["Play Type", "event_type"] if col in plays_df.columns), None)
                     
                     if key_for_chart and not plays_df[key_for_chart].isna().all() and not (plays_df[key_for_chart] == 'None').all():
-                        play_type_counts = plays_df[key_for_chart].value_counts().reset_index()
-                        play_type_counts.columns = [key_for_chart, "Count"]
-                        
-                        chart = alt.Chart(play_type_counts).mark_bar().encode(
-                            y=alt.Y(f"{key_for_chart}:N", sort="-x"),
-                            x=alt.X("Count:Q"),
-                            tooltip=[key_for_chart, "Count"]
-                        ).properties(
-                            title=f"Play Type Distribution for {team} - Season {season}",
-                            width=600,
-                            height=400
-                        )
+                        plays_df[key_for_chart] = plays_df[key_for_chart].astype("category")
+                        play_type_counts = plays_df.groupby(key_for_chart, observed=True, sort=False).size().reset_index(name="Count")
                         
-                        st.altair_chart(chart, use_container_width=True)
+                        spec = _play_type_chart_spec(key_for_chart, f"Play Type Distribution for {team} - Season {season}")
+                        st.vega_lite_chart(play_type_counts, spec, use_container_width=True)
                 else:
                     st.warning(f"No plays data found for {team} in season {season}.")
         except Exception as e:
-            st.error(f"Error loading plays data: {e}")
-            import traceback
-            st.text(traceback.format_exc())
+            _show_exc(f"Error loading plays data: {e}")
     
     with tab3:
         st.markdown("### Play Data Debug")
@@ -2684,8 +2871,8 @@ elif page == "Plays" and client:
                     
                     # Show the raw data for the first play
                     st.subheader("First Play Raw Data")
-                    if hasattr(plays_data[0], 'get_raw_data'):
-                        raw_data = plays_data[0].get_raw_data()
+                    raw_data = _raw(plays_data[0])
+                    if raw_data:
                         st.json(raw_data)
                         
                         # Check available fields
@@ -2697,13 +2884,11 @@ elif page == "Plays" and client:
                         for field in ['id', 'gameId', 'playType', 'team', 'period', 'clock']:
                             st.write(f"{field}: {raw_data.get(field, 'Not available')}")
                     else:
-                        st.warning("Raw data method not available on Play objects")
+                        st.warning("Raw data not available on Play objects")
                 else:
                     st.warning(f"No plays data found for game ID {debug_game_id}")
             except Exception as e:
-                st.error(f"Error checking API data: {e}")
-                import traceback
-                st.text(traceback.format_exc())
+                _show_exc(f"Error checking API data: {e}")
 
 elif page == "Lines" and client:
     st.markdown('<div class="main-header">Betting Lines</div>', unsafe_allow_html=True)
@@ -2719,34 +2904,25 @@ elif page == "Lines" and client:
                 # Show a sample of the raw data in expandable section
                 with st.expander("Raw Data Sample"):
                     if len(lines_data) > 0:
-                        if hasattr(lines_data[0], 'get_raw_data'):
-                            st.json(lines_data[0].get_raw_data())
-                        else:
-                            # If get_raw_data is not available, try to get the dictionary representation
-                            try:
-                                st.json(lines_data[0].__dict__.get('_data', {}))
-                            except:
-                                st.write("Raw data not available")
+                        st.json(_preview(_raw(lines_data[0])), expanded=False)
                 
                 # Convert to DataFrame for better display
-                all_lines = []
-                
-                for line in lines_data:
-                    all_lines.append({
-                        "Game ID": line.game_id,
-                        "Date": getattr(line, 'start_date', None),
-                        "Home Team": line.home_team,
-                        "Away Team": line.away_team,
-                        "Provider": line.provider,
-                        "Spread": line.spread,
-                        "Over/Under": line.over_under,
-                        "Home Moneyline": line.home_moneyline,
-                        "Away Moneyline": line.away_moneyline
+                lines_df = records_frame(lines_data, LINE_COLUMNS)
+                if lines_df is None:
+                    lines_df = pd.DataFrame({
+                        "Game ID": [line.game_id for line in lines_data],
+                        "Home Team": [line.home_team for line in lines_data],
+                        "Away Team": [line.away_team for line in lines_data],
+                        "Provider": [line.provider for line in lines_data],
+                        "Spread": [line.spread for line in lines_data],
+                        "Over/Under": [line.over_under for line in lines_data],
+                        "Home Moneyline": [line.home_moneyline for line in lines_data],
+                        "Away Moneyline": [line.away_moneyline for line in lines_data]
                     })
-                
-                if all_lines:
-                    lines_df = pd.DataFrame(all_lines)
-                    st.dataframe(lines_df)
+
+                if not lines_df.empty:
+                    lines_df = _arrow_dtypes(lines_df)
+                    st.dataframe(lines_df, use_container_width=True, hide_index=True)
                     
                     # Spread distribution
                     if len(lines_df) > 0 and "Spread" in lines_df.columns:
@@ -2754,17 +2930,8 @@ elif page == "Lines" and client:
                         spread_df = lines_df[lines_df["Spread"].notna()]
                         
                         if not spread_df.empty:
-                            hist = alt.Chart(spread_df).mark_bar().encode(
-                                x=alt.X("Spread:Q", bin=True),
-                                y="count()",
-                                tooltip=["count()", "Spread:Q"]
-                            ).properties(
-                                title=f"Spread Distribution - Season {season}",
-                                width=600,
-                                height=300
-                            )
-                            
-                            st.altair_chart(hist, use_container_width=True)
+                            spec = _histogram_spec("Spread", f"Spread Distribution - Season {season}")
+                            st.vega_lite_chart(_bin_counts(spread_df["Spread"]), spec, use_container_width=True)
                     
                     # Over/Under distribution
                     if len(lines_df) > 0 and "Over/Under" in lines_df.columns:
@@ -2772,25 +2939,14 @@ elif page == "Lines" and client:
                         ou_df = lines_df[lines_df["Over/Under"].notna()]
                         
                         if not ou_df.empty:
-                            hist = alt.Chart(ou_df).mark_bar().encode(
-                                x=alt.X("Over/Under:Q", bin=True),
-                                y="count()",
-                                tooltip=["count()", "Over/Under:Q"]
-                            ).properties(
-                                title=f"Over/Under Distribution - Season {season}",
-                                width=600,
-                                height=300
-                            )
-                            
-                            st.altair_chart(hist, use_container_width=True)
+                            spec = _histogram_spec("Over/Under", f"Over/Under Distribution - Season {season}")
+                            st.vega_lite_chart(_bin_counts(ou_df["Over/Under"]), spec, use_container_width=True)
                 else:
                     st.warning(f"No lines details found for {team} in season {season}.")
             else:
                 st.warning(f"No betting lines data found for {team} in season {season}.")
     except Exception as e:
-        st.error(f"Error loading betting lines data: {e}")
-        import traceback
-        st.text(traceback.format_exc())
+        _show_exc(f"Error loading betting lines data: {e}")
 
 else:
     if page == "Conferences":
@@ -2941,8 +3097,15 @@ else:
                                     conference_games = games_df[games_df['conferenceGame'] == True]
                                     non_conference_games = games_df[games_df['conferenceGame'] == False]
                                 elif has_conference_fields:
-                                    # Use conference fields to determine conference games
-                                    same_conf_mask = games_df['homeConference'] == games_df['awayConference']
+                                    # Use conference fields to determine conference games, comparing
+                                    # categorical codes over a shared category index instead of strings
+                                    conferences = pd.api.types.union_categoricals([
+                                        pd.Categorical(games_df['homeConference']),
+                                        pd.Categorical(games_df['awayConference'])
+                                    ]).categories
+                                    home_codes = pd.Categorical(games_df['homeConference'], categories=conferences).codes
+                                    away_codes = pd.Categorical(games_df['awayConference'], categories=conferences).codes
+                                    same_conf_mask = pd.Series((home_codes == away_codes) & (home_codes >= 0), index=games_df.index)
                                     conference_games_count = same_conf_mask.sum()
                                     non_conference_games_count = len(games_df) - conference_games_count
                                     conference_games = games_df[same_conf_mask]
@@ -2982,13 +3145,9 @@ else:
                         else:
                             st.warning(f"No data found for {conference_abbr} in season {season}.")
                     except Exception as e:
-                        st.error(f"Error loading conference data: {e}")
-                        import traceback
-                        st.text(traceback.format_exc())
+                        _show_exc(f"Error loading conference data: {e}")
         except Exception as e:
-            st.error(f"Error loading conferences: {e}")
-            import traceback
-            st.text(traceback.format_exc())
+            _show_exc(f"Error loading conferences: {e}")
     
     elif page != "Home":
         st.warning("Please enter a valid API key to use this page.") 
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Record-based DataFrame builders for the Streamlit app.
+
+The tables for plays, betting lines and SRS ratings are built straight from
+the SDK models' raw data rather than through their properties.
+"""
+
+import pandas as pd
+
+# Raw API keys -> display column names for the DataFrame builders
+PLAY_COLUMNS = {
+    "gameId": "Game ID",
+    "period": "Period",
+    "clock": "Clock",
+    "team": "Team",
+    "player": "Player",
+    "playType": "Play Type",
+    "homeScore": "Home Score",
+    "awayScore": "Away Score",
+    "playText": "Description",
+}
+# Snake-case keys the Play model falls back to when the camelCase key is missing
+PLAY_FALLBACK_KEYS = {
+    "gameId": ("game_id",),
+    "homeScore": ("home_score",),
+    "awayScore": ("away_score",),
+}
+TEAM_PLAY_COLUMNS = {
+    **PLAY_COLUMNS,
+    "scoringPlay": "Scoring Play",
+    "shootingPlay": "Shooting Play",
+}
+LINE_COLUMNS = {
+    "game_id": "Game ID",
+    "home_team": "Home Team",
+    "away_team": "Away Team",
+    "provider": "Provider",
+    "spread": "Spread",
+    "over_under": "Over/Under",
+    "home_moneyline": "Home Moneyline",
+    "away_moneyline": "Away Moneyline",
+}
+SRS_COLUMNS = {
+    "team": "Team",
+    "conference": "Conference",
+    "rating": "Rating",
+}
+
+
+def records_frame(items, columns, fallbacks=None):
+    """
+    Build a display DataFrame straight from the models' raw ``_data`` dicts.
+
+    Args:
+        items: Non-empty sequence of SDK model objects
+        columns: Mapping of raw API keys to display column names
+        fallbacks: Optional mapping of raw API keys to alternate keys whose
+            values fill in where the main key is missing, as the model
+            properties do
+
+    Returns:
+        The DataFrame, or None if the models don't expose ``_data`` and the
+        caller has to fall back to attribute access.
+    """
+    if not isinstance(getattr(items[0], '_data', None), dict):
+        return None
+    df = pd.DataFrame.from_records([item._data for item in items])
+    for key, alternates in (fallbacks or {}).items():
+        for alternate in alternates:
+            if alternate not in df.columns:
+                continue
+            df[key] = df[key].fillna(df[alternate]) if key in df.columns else df[alternate]
+    return df.reindex(columns=list(columns)).rename(columns=columns)
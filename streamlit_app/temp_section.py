@@ -13,30 +13,32 @@
                             
                             if len(pos_counts) > 1:  # Only create chart if we have multiple positions
                                 # Pie chart for positions
-                                position_fig, ax = plt.subplots(figsize=(8, 8))
-                                ax.pie(pos_counts["Count"], labels=pos_counts["Position"], autopct='%1.1f%%', 
-                                      startangle=90, shadow=False)
-                                ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
-                                plt.title(f"Position Breakdown for {team} ({season})")
-                                st.pyplot(position_fig)
+                                position_chart = alt.Chart(pos_counts).mark_arc(innerRadius=0).encode(
+                                    theta=alt.Theta("Count:Q"),
+                                    color=alt.Color("Position:N", scale=alt.Scale(scheme="category10")),
+                                    tooltip=["Position", "Count"]
+                                ).properties(
+                                    title=f"Position Breakdown for {team} ({season})",
+                                    width=400,
+                                    height=400
+                                )
+                                
+                                st.altair_chart(position_chart, use_container_width=True)
                             
-                            # Table of players by position
+                            # Table of players by position, rendered as a single markdown block
                             st.subheader("Players by Position")
-                            for position in pos_counts["Position"]:
-                                position_players = roster_df[roster_df["Position"] == position]
-                                st.markdown(f"**{position}** ({len(position_players)}): " + 
-                                            ", ".join(position_players["Name"].tolist()))
-
-                            # Position breakdown
-                            for position in sorted(roster_df["Position"].unique()):
-                                position_players = roster_df[roster_df["Position"] == position].sort_values("Jersey")
-                                st.markdown(f"**{position}** ({len(position_players)}): " + 
-                                        ", ".join(position_players["Name"].tolist()))
+                            position_lines = []
+                            for position, position_players in roster_df.sort_values("Jersey").groupby("Position", sort=True):
+                                position_lines.append(f"**{position}** ({len(position_players)}): " + 
+                                                      ", ".join(position_players["Name"]))
+                            st.markdown("\n\n".join(position_lines))
                             
                             # Position experience breakdown - only if we have experience data
                             if "Experience" in roster_df.columns and not roster_df["Experience"].isna().all():
-                                exp_by_pos = roster_df.groupby("Position")["Experience"].mean().reset_index()
-                                exp_by_pos.columns = ["Position", "Avg Experience"]
+                                exp_df = roster_df[["Position", "Experience"]].astype({"Position": "category"})
+                                exp_df["Experience"] = pd.to_numeric(exp_df["Experience"], downcast="float")
+                                roster_hash = int(pd.util.hash_pandas_object(exp_df, index=False).sum())
+                                exp_by_pos = _experience_by_position(team, season, roster_hash, exp_df)
                                 
                                 if len(exp_by_pos) > 1:  # Only create chart if we have multiple positions
                                     exp_chart = alt.Chart(exp_by_pos).mark_bar().encode(
@@ -56,6 +58,4 @@
                  else:
                      st.warning(f"No roster data found for {team} in {season}.")
          except Exception as e:
-             st.error(f"Error loading roster data: {e}")
-             import traceback
-             st.text(traceback.format_exc())
+             _show_exc(f"Error loading roster data: {e}")
@@ -0,0 +1,60 @@
+"""
+On-disk cache of advanced API results shared by the API test scripts.
+"""
+
+import json
+from pathlib import Path
+
+# Directory holding the cached profiles alongside the other mock responses
+PROFILE_DIR = Path(__file__).parent / 'mock_responses'
+
+# Profiles already loaded or fetched in this process
+_profiles = {}
+
+
+def profile_path(conference, season):
+    """
+    Get the path of the cached profile for a conference season.
+
+    Args:
+        conference: Conference name or abbreviation
+        season: Season year
+
+    Returns:
+        Path of the profile JSON file in tests/mock_responses
+    """
+    return PROFILE_DIR / f"profile_{conference.replace(' ', '_')}_{season}.json"
+
+
+def get_profile(client, conference, season):
+    """
+    Get a conference season profile, fetching it at most once.
+
+    The profile is read from tests/mock_responses/profile_{conference}_{season}.json
+    when that file exists. Otherwise it is fetched with
+    client.advanced.conference_season.get_profile and written there.
+
+    Args:
+        client: CBBDClient used when the profile is not cached yet, or None
+            when the profile is known to be recorded
+        conference: Conference name or abbreviation
+        season: Season year
+
+    Returns:
+        The conference season profile dictionary
+    """
+    key = (conference, season)
+    if key in _profiles:
+        return _profiles[key]
+
+    path = profile_path(conference, season)
+    if path.exists():
+        with open(path, 'r') as f:
+            profile = json.load(f)
+    else:
+        profile = client.advanced.conference_season.get_profile(conference, season)
+        with open(path, 'w') as f:
+            json.dump(profile, f, indent=2)
+
+    _profiles[key] = profile
+    return profile
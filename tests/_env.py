@@ -0,0 +1,31 @@
+"""
+Environment shared by the test suite and the API test scripts.
+
+The .env file is parsed and the API key is read once, on first import.
+"""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+from cbbd import CBBDClient
+
+# Load environment variables from .env file
+load_dotenv()
+
+# API key for tests that call the live API, or None when it is not set
+API_KEY = os.getenv('CBBD_API_KEY') or os.getenv('CFBD_API_KEY')
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    """
+    Get the live API client shared by the test scripts.
+
+    Returns:
+        A CBBDClient using API_KEY, or None when no API key is set
+    """
+    if not API_KEY:
+        return None
+    return CBBDClient(api_key=API_KEY)
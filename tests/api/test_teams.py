@@ -3,19 +3,15 @@ Tests for the Teams API.
 """
 
 import pytest
-import responses
-from cbbd.constants import Endpoints
 from cbbd.models.team import Team, TeamList, TeamRoster
 
 
 class TestTeamsAPI:
     """Tests for the Teams API."""
     
-    @responses.activate
-    def test_get_teams(self, mock_client, register_mock_endpoints):
+    def test_get_teams(self, mock_client, responses_mock, mock_payloads):
         """Test getting teams."""
-        # Register mock endpoint
-        mock_data = register_mock_endpoints(Endpoints.TEAMS, 'teams.json')
+        mock_data = mock_payloads['teams.json']
         
         # Make the request
         teams = mock_client.teams.get_teams()
@@ -28,15 +24,12 @@ class TestTeamsAPI:
         for i, team in enumerate(teams):
             assert isinstance(team, Team)
             assert team.id == mock_data[i]['id']
-            assert team.name == mock_data[i]['name']
+            assert team.name == mock_data[i]['school']
             assert team.conference == mock_data[i]['conference']
     
-    @responses.activate
-    def test_get_teams_with_filters(self, mock_client, register_mock_endpoints):
+    def test_get_teams_with_filters(self, mock_client, responses_mock, mock_payloads):
         """Test getting teams with filters."""
-        # Register mock endpoint with filters
-        params = {'conference': 'ACC', 'season': 2023}
-        mock_data = register_mock_endpoints(Endpoints.TEAMS, 'teams.json', params=params)
+        mock_data = mock_payloads['teams.json']
         
         # Make the request
         teams = mock_client.teams.get_teams(conference='ACC', season=2023)
@@ -45,12 +38,9 @@ class TestTeamsAPI:
         assert isinstance(teams, TeamList)
         assert len(teams) == len(mock_data)
     
-    @responses.activate
-    def test_get_roster(self, mock_client, register_mock_endpoints):
+    def test_get_roster(self, mock_client, responses_mock, mock_payloads):
         """Test getting team roster."""
-        # Register mock endpoint
-        params = {'team': 'Duke', 'season': 2023}
-        mock_data = register_mock_endpoints(Endpoints.TEAMS_ROSTER, 'team_roster.json', params=params)
+        mock_data = mock_payloads['team_roster.json']
         
         # Make the request
         roster = mock_client.teams.get_roster(team='Duke', season=2023)
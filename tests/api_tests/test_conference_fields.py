@@ -1,113 +1,163 @@
 """
-Direct test script to examine field names in the API response.
+Field name tests for the API responses.
 
-This script extracts data from the API and prints out the field names.
+These tests check the field names returned by the conference, team and
+game endpoints and how the models and the advanced API expose them.
+By default the responses are replayed from a recorded fixture; set
+RESPONSES_PASSTHROUGH=1 to probe the live API instead.
 """
 
 import os
 import sys
-import json
-from pprint import pprint
-from dotenv import load_dotenv
+import pytest
+import responses
+import yaml
+from pathlib import Path
 
 # Add the project root to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-# Load environment variables
-load_dotenv()
-
 from cbbd import CBBDClient
+from cbbd.constants import BASE_URL
+
+# Recorded responses for every request made by this module
+RECORDED_RESPONSES = Path(__file__).parent.parent / 'mock_responses' / 'conference_fields.yaml'
+
+# Game fields as (model property, raw API field)
+GAME_FIELDS = [
+    ("home_team", "homeTeam"),
+    ("away_team", "awayTeam"),
+    ("home_conference", "homeConference"),
+    ("away_conference", "awayConference"),
+    ("conference_game", "conferenceGame"),
+]
+
+
+def add_recorded_responses(rsps, path):
+    """
+    Register every response in a recorded responses YAML file.
+
+    Args:
+        rsps: RequestsMock to register the responses with
+        path: Path of a file written by the responses recorder
+    """
+    with open(path, 'r') as f:
+        recorded = yaml.safe_load(f)
+
+    for entry in recorded['responses']:
+        response = entry['response']
+        # responses rejects a Content-Type header next to content_type, so the
+        # recorded header, which holds the real type, becomes content_type
+        headers = dict(response.get('headers') or {})
+        content_type = next(
+            (headers.pop(key) for key in list(headers) if key.lower() == 'content-type'),
+            response['content_type']
+        )
+        rsps.add(
+            method=response['method'],
+            url=response['url'],
+            body=response['body'],
+            status=response['status'],
+            headers=headers or None,
+            content_type=content_type,
+            auto_calculate_content_length=response['auto_calculate_content_length']
+        )
+
+
+@pytest.fixture(scope="module")
+def fields_client(request):
+    """
+    Fixture for the client used by the field name tests.
+
+    Replays the recorded responses unless RESPONSES_PASSTHROUGH=1 is set,
+    in which case requests pass through to the live API.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        if os.getenv("RESPONSES_PASSTHROUGH") == "1":
+            rsps.add_passthru(BASE_URL)
+            yield request.getfixturevalue("live_client")
+        else:
+            add_recorded_responses(rsps, RECORDED_RESPONSES)
+            yield CBBDClient(api_key="mock-api-key")
+
+
+@pytest.fixture(scope="module")
+def cached_conferences(fields_client):
+    """Fixture for the conference list, fetched once per module."""
+    return fields_client.conferences.get_conferences()
+
+
+@pytest.fixture(scope="module")
+def cached_teams_2025(fields_client):
+    """Fixture for the 2025 team list, fetched once per module."""
+    return fields_client.teams.get_teams(season=2025)
+
+
+@pytest.fixture(scope="module")
+def cached_sec_teams_2025(fields_client):
+    """Fixture for the 2025 SEC team list, fetched once per module."""
+    return fields_client.teams.get_teams(conference="SEC", season=2025)
+
+
+@pytest.fixture(scope="module")
+def cached_kentucky_game_2025(fields_client):
+    """Fixture for the first 2025 Kentucky game, fetched once per module."""
+    games = fields_client.games.get_games(season=2025, team="Kentucky")
+    assert len(games) > 0
+    return games[0]
+
+
+@pytest.fixture(scope="module")
+def cached_sec_profile_2025(fields_client):
+    """Fixture for the 2025 SEC conference season profile, built once per module."""
+    return fields_client.advanced.conference_season.get_profile(conference="SEC", season=2025)
+
+
+@pytest.mark.parametrize("field", ["id", "name", "abbreviation", "shortName"])
+def test_conference_has_expected_fields(cached_conferences, field):
+    """Test the raw conference data contains the expected field"""
+    assert len(cached_conferences) > 0
+    assert field in cached_conferences[0]._data
+
+
+@pytest.mark.parametrize("field", ["school", "conference", "conferenceId"])
+def test_team_has_conference_field(cached_teams_2025, field):
+    """Test the raw team data contains the expected field"""
+    assert len(cached_teams_2025) > 0
+    assert field in cached_teams_2025[0]._data
+
+
+def test_team_name_is_school(cached_teams_2025):
+    """Test Team.name exposes the raw school field"""
+    team = cached_teams_2025[0]
+    assert team.name == team._data["school"]
+
+
+def test_sec_teams_have_sec_conference(cached_sec_teams_2025):
+    """Test filtering teams by conference returns only SEC teams"""
+    assert len(cached_sec_teams_2025) > 0
+    assert all(team.conference == "SEC" for team in cached_sec_teams_2025)
+
+
+@pytest.mark.parametrize("prop,field", GAME_FIELDS)
+def test_game_has_expected_fields(cached_kentucky_game_2025, prop, field):
+    """Test the raw game field is present and exposed by its model property"""
+    raw_data = cached_kentucky_game_2025._data
+    assert field in raw_data
+    assert getattr(cached_kentucky_game_2025, prop) == raw_data[field]
+
+
+def test_profile_has_expected_keys(cached_sec_profile_2025):
+    """Test the conference season profile contains the expected sections"""
+    assert set(cached_sec_profile_2025) >= {"conference", "season", "teams", "games", "standings"}
+
+
+@pytest.mark.parametrize("field", [field for _, field in GAME_FIELDS])
+def test_profile_game_has_expected_fields(cached_sec_profile_2025, field):
+    """Test games in the conference season profile keep the raw API field names"""
+    assert len(cached_sec_profile_2025["games"]) > 0
+    assert field in cached_sec_profile_2025["games"][0]
 
-def test_field_names():
-    """Test the field names in the API response"""
-    # Initialize client
-    api_key = os.getenv("CBBD_API_KEY") or os.getenv("CFBD_API_KEY")
-    client = CBBDClient(api_key=api_key)
-    
-    print("\n=== TESTING FIELD NAMES IN API RESPONSE ===")
-    
-    # Test conferences
-    print("\n1. Testing Conference Fields")
-    conferences = client.conferences.get_conferences()
-    if conferences:
-        print(f"Found {len(conferences)} conferences")
-        conf = conferences[0]
-        print(f"Conference fields: {dir(conf)}")
-        print(f"Raw data: {conf._data}")
-    
-    # Test teams for 2025
-    print("\n2. Testing Team Fields (2025)")
-    teams_2025 = client.teams.get_teams(season=2025)
-    if teams_2025:
-        print(f"Found {len(teams_2025)} teams for 2025")
-        team = teams_2025[0]
-        print(f"Team fields: {dir(team)}")
-        print(f"Raw data: {team._data}")
-        print(f"Team.name: {team.name}, Team.conference: {team.conference}")
-    
-    # Test SEC teams for 2025
-    print("\n3. Testing SEC Teams (2025)")
-    sec_teams = client.teams.get_teams(conference="SEC", season=2025)
-    print(f"Found {len(sec_teams)} SEC teams for 2025")
-    for team in sec_teams:
-        print(f"  {team.name}: conference = '{team.conference}'")
-    
-    # Test games for 2025
-    print("\n4. Testing Game Fields (2025)")
-    games_2025 = client.games.get_games(season=2025, team="Kentucky")
-    if games_2025:
-        print(f"Found {len(games_2025)} games for Kentucky in 2025")
-        game = games_2025[0]
-        print(f"Game fields: {dir(game)}")
-        
-        # Check specific fields
-        fields_to_check = [
-            "home_team", "homeTeam", 
-            "away_team", "awayTeam",
-            "home_conference", "homeConference", 
-            "away_conference", "awayConference",
-            "conference_game", "conferenceGame"
-        ]
-        
-        print("\nChecking field access:")
-        raw_data = game._data if hasattr(game, '_data') else game.__dict__
-        print(f"Raw data keys: {list(raw_data.keys())}")
-        
-        for field in fields_to_check:
-            try:
-                value = getattr(game, field) if hasattr(game, field) else "Field not found"
-                print(f"  {field}: {value}")
-            except Exception as e:
-                print(f"  {field}: Error - {str(e)}")
-
-        # Check if conferenceGame exists and its value
-        if hasattr(game, "conferenceGame") or "conferenceGame" in raw_data:
-            print(f"\nconferenceGame value: {getattr(game, 'conferenceGame', raw_data.get('conferenceGame', 'Not found'))}")
-        
-        # Now test how to properly access these fields with correct casing
-        print("\nAccessing with model properties:")
-        try:
-            print(f"  home_team via property: {game.home_team}")
-            print(f"  away_team via property: {game.away_team}")
-            print(f"  conference_game via property: {game.conference_game}")
-        except Exception as e:
-            print(f"  Error accessing properties: {str(e)}")
-    
-    # Test how the advanced API exposes the data
-    print("\n5. Testing Advanced API (Conference Season)")
-    profile = client.advanced.conference_season.get_profile(conference="SEC", season=2025)
-    
-    print(f"Profile keys: {list(profile.keys())}")
-    
-    # Check game format in the profile
-    if "games" in profile and profile["games"]:
-        print(f"Number of games in profile: {len(profile['games'])}")
-        sample_game = profile["games"][0]
-        print(f"Sample game fields in profile: {list(sample_game.keys())}")
-        
-        # Check how conference fields are named in the profile
-        conference_fields = [key for key in sample_game.keys() if "conf" in key.lower()]
-        print(f"Conference-related fields: {conference_fields}")
 
 if __name__ == "__main__":
-    test_field_names() 
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
@@ -4,22 +4,24 @@ Test script for ConferenceSeason advanced API functionality.
 import os
 import sys
 import logging
-from dotenv import load_dotenv
+import pytest
+from collections import defaultdict
+from functools import singledispatch
+from itertools import islice
 from pprint import pprint
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Keep the live API calls from this module on one xdist worker
+pytestmark = pytest.mark.xdist_group("live_api")
+
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-# Load environment variables from .env file
-load_dotenv()
-
-from cbbd.client import CBBDClient
+from cbbd.models.team import Team
+from tests._env import get_client
 
+@singledispatch
 def get_team_name(team):
     """
     Safely get the name/school of a team, handling different object types.
@@ -28,11 +30,18 @@ def get_team_name(team):
         return team.name
     elif hasattr(team, 'school'):
         return team.school
-    elif isinstance(team, dict):
-        return team.get('name') or team.get('school') or "(unknown)"
     else:
         return str(team)
 
+@get_team_name.register(Team)
+def _(team):
+    return team.name
+
+@get_team_name.register(dict)
+def _(team):
+    return team.get('name') or team.get('school') or "(unknown)"
+
+@singledispatch
 def get_team_conference_id(team):
     """
     Safely get the conference ID of a team, handling different object types.
@@ -49,30 +58,26 @@ def get_team_conference_id(team):
     if hasattr(team, 'conference_id'):
         return team.conference_id
     
-    if isinstance(team, dict):
-        if 'conference' in team:
-            conf = team['conference']
-            if isinstance(conf, dict) and 'id' in conf:
-                return conf['id']
-            elif isinstance(conf, str) and conf.isdigit():
-                return int(conf)
-        if 'conferenceId' in team:
-            return team['conferenceId']
-    
     return None
 
-def test_conference_season():
+@get_team_conference_id.register(Team)
+def _(team):
+    return team.conference_id
+
+@get_team_conference_id.register(dict)
+def _(team):
+    if 'conference' in team:
+        conf = team['conference']
+        if isinstance(conf, dict) and 'id' in conf:
+            return conf['id']
+        elif isinstance(conf, str) and conf.isdigit():
+            return int(conf)
+    return team.get('conferenceId')
+
+def test_conference_season(live_client):
     """Test the ConferenceSeason functionality with detailed logging."""
     logger.info("Starting ConferenceSeason test")
-    
-    # Initialize the client with API key from environment
-    api_key = os.getenv('CBBD_API_KEY') or os.getenv('CFBD_API_KEY')
-    if not api_key:
-        logger.error("No API key found in environment variables. Set CBBD_API_KEY or CFBD_API_KEY.")
-        return
-    
-    logger.info(f"Using API key: {api_key[:5]}..." if api_key else "No API key found")
-    client = CBBDClient(api_key=api_key)
+    client = live_client
     
     # Test ConferenceSeason initialization
     logger.info("Testing ConferenceSeason initialization")
@@ -90,22 +95,22 @@ def test_conference_season():
         logger.info(f"Retrieved {len(conferences)} conferences")
         
         # Log the first conference to see its structure
-        if conferences:
-            logger.info("First conference data structure:")
+        if conferences and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First conference data structure:")
             first_conf = conferences[0]
             if hasattr(first_conf, '__dict__'):
-                logger.info(f"Conference is an object with attributes: {dir(first_conf)}")
-                logger.info(f"Conference __dict__: {first_conf.__dict__}")
-                logger.info(f"Raw data from to_dict(): {first_conf.to_dict()}")
+                logger.debug("Conference is an object with attributes: %s", list(vars(first_conf)))
+                logger.debug("Conference __dict__: %s", first_conf.__dict__)
+                logger.debug("Raw data from to_dict(): %s", first_conf.to_dict())
             else:
-                logger.info(f"Conference is a dictionary: {first_conf}")
+                logger.debug("Conference is a dictionary: %s", first_conf)
                 
         # Get SEC conference for later reference
         sec_conf = None
         for conf in conferences:
             if hasattr(conf, 'abbreviation') and conf.abbreviation == 'SEC':
                 sec_conf = conf
-                logger.info(f"Found SEC conference: {conf.to_dict()}")
+                logger.debug("Found SEC conference: %s", conf.to_dict())
                 break
     except Exception as e:
         logger.error(f"Error getting conferences: {str(e)}")
@@ -117,40 +122,38 @@ def test_conference_season():
         logger.info(f"Retrieved {len(teams)} teams for 2023")
         
         # Log the first team to see its structure
-        if teams:
-            logger.info("First team data structure:")
-            first_team = teams[0]
+        first_team = teams[0] if teams else None
+        if teams and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First team data structure:")
             if hasattr(first_team, '__dict__'):
-                logger.info(f"Team is an object with attributes: {dir(first_team)}")
-                logger.info(f"Team __dict__: {first_team.__dict__}")
-                logger.info(f"Raw data from to_dict(): {first_team.to_dict()}")
+                logger.debug("Team is an object with attributes: %s", list(vars(first_team)))
+                logger.debug("Team __dict__: %s", first_team.__dict__)
+                logger.debug("Raw data from to_dict(): %s", first_team.to_dict())
             else:
-                logger.info(f"Team is a dictionary: {first_team}")
+                logger.debug("Team is a dictionary: %s", first_team)
                 
         # Check the actual field for the team name
         team_name_field = None
         if hasattr(first_team, 'name'):
             team_name_field = 'name'
-            logger.info(f"Team name field is 'name': {first_team.name}")
+            logger.info("Team name field is 'name': %s", first_team.name)
         elif hasattr(first_team, 'school'):
             team_name_field = 'school'
-            logger.info(f"Team name field is 'school': {first_team.school}")
-        else:
-            logger.info(f"Could not determine team name field. Available fields: {dir(first_team)}")
+            logger.info("Team name field is 'school': %s", first_team.school)
+        elif logger.isEnabledFor(logging.DEBUG):
+            fields = list(vars(first_team)) if hasattr(first_team, '__dict__') else list(first_team or [])
+            logger.debug("Could not determine team name field. Available fields: %s", fields)
             
+        # Group team names by conference ID in a single pass
+        teams_by_conf = defaultdict(list)
+        for team in teams:
+            teams_by_conf[get_team_conference_id(team)].append(get_team_name(team))
+        
         # Check conference ID mapping directly
-        sec_teams = []
         logger.info("Looking for SEC teams directly:")
         sec_id = 24  # SEC conference ID
+        sec_teams = teams_by_conf.get(sec_id, [])
         
-        for team in teams:
-            conf_id = get_team_conference_id(team)
-            team_name = get_team_name(team)
-            
-            if conf_id == sec_id:
-                sec_teams.append(team_name)
-                logger.info(f"Found SEC team: {team_name}")
-                
         logger.info(f"Found {len(sec_teams)} SEC teams by direct identification: {sec_teams}")
         
         # Try calling get_teams with a conference parameter
@@ -159,8 +162,8 @@ def test_conference_season():
             conf_teams = client.teams.get_teams(conference='SEC', season=2023)
             logger.info(f"Retrieved {len(conf_teams)} SEC teams using conference parameter")
             
-            if conf_teams:
-                logger.info(f"SEC teams using conference parameter: {[get_team_name(team) for team in conf_teams]}")
+            if conf_teams and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("SEC teams using conference parameter: %s", [get_team_name(team) for team in conf_teams])
         except Exception as e:
             logger.error(f"Error getting teams with conference parameter: {str(e)}")
     except Exception as e:
@@ -179,78 +182,61 @@ def test_conference_season():
         logger.error(f"Error inspecting get_teams: {str(e)}")
     
     # Debug how conference filtering works in our codebase
-    logger.info("Checking our conference team filtering logic:")
+    logger.debug("Checking our conference team filtering logic:")
     try:
-        for i, team in enumerate(teams[:20]):  # Look at first 20 teams
-            team_name = get_team_name(team)
-            logger.info(f"Team {i+1}: {team_name}")
-            
-            if hasattr(team, 'conference'):
-                conf = team.conference
-                if hasattr(conf, 'id'):
-                    logger.info(f"  conference.id = {conf.id}")
-                elif isinstance(conf, str):
-                    logger.info(f"  conference = '{conf}'")
-                elif isinstance(conf, dict):
-                    logger.info(f"  conference dict: {conf}")
-                else:
-                    logger.info(f"  unknown conference type: {type(conf)}")
-            
-            if hasattr(team, 'conference_id'):
-                logger.info(f"  conference_id = {team.conference_id}")
-            
-            # Check for dictionary format
-            if isinstance(team, dict):
-                if 'conference' in team:
-                    conf = team.get('conference')
-                    if isinstance(conf, dict):
-                        logger.info(f"  conference dict: {conf}")
-                    else:
-                        logger.info(f"  conference = '{conf}'")
-                if 'conferenceId' in team:
-                    logger.info(f"  conferenceId = {team.get('conferenceId')}")
+        for conf_id, team_names in islice(teams_by_conf.items(), 20):  # Look at first 20 conferences
+            logger.debug("Conference %s: %d teams: %s", conf_id, len(team_names), team_names)
     except Exception as e:
         logger.error(f"Error examining team conference data: {str(e)}")
         import traceback
         logger.error(traceback.format_exc())
     
-    # Test the conference_season.get_profile method for a known conference
-    test_conferences = [
-        {"name": "SEC", "season": 2023},
-        {"name": "Big Ten", "season": 2023},
-        {"name": "A-10", "season": 2023},  # Atlantic 10
-    ]
+    logger.info("ConferenceSeason test completed")
+
+# Test the conference_season.get_profile method for known conferences
+TEST_CONFERENCES = [
+    ("SEC", 2023),
+    ("Big Ten", 2023),
+    ("A-10", 2023),  # Atlantic 10
+]
+
+@pytest.mark.parametrize("conf_name,season", TEST_CONFERENCES)
+def test_conference_profile(live_client, conf_name, season):
+    """Test ConferenceSeason.get_profile for a single conference and season."""
+    conference_season = live_client.advanced.conference_season
+    logger.info(f"Testing get_profile for {conf_name} in {season}")
     
-    for conf_data in test_conferences:
-        conf_name = conf_data["name"]
-        season = conf_data["season"]
-        logger.info(f"Testing get_profile for {conf_name} in {season}")
+    try:
+        logger.info(f"Calling conference_season.get_profile({conf_name}, {season})")
+        profile = conference_season.get_profile(conf_name, season)
         
-        try:
-            logger.info(f"Calling conference_season.get_profile({conf_name}, {season})")
-            profile = conference_season.get_profile(conf_name, season)
-            
-            logger.info(f"Profile keys: {list(profile.keys())}")
-            logger.info(f"Conference: {profile['conference']}")
-            logger.info(f"Number of teams: {len(profile['teams'])}")
-            logger.info(f"Number of games: {len(profile['games'])}")
-            logger.info(f"Number of standings: {len(profile['standings'])}")
-            
-            # Check the format of games
-            if profile['games']:
-                logger.info("First game data structure:")
-                first_game = profile['games'][0]
-                if hasattr(first_game, '__dict__'):
-                    logger.info(f"Game is an object with attributes: {dir(first_game)}")
-                    logger.info(f"Game __dict__: {first_game.__dict__}")
-                else:
-                    logger.info(f"Game is a dictionary with keys: {list(first_game.keys())}")
-        except Exception as e:
-            logger.error(f"Error getting profile for {conf_name}: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-    
-    logger.info("ConferenceSeason test completed")
+        logger.info(f"Profile keys: {list(profile.keys())}")
+        logger.info(f"Conference: {profile['conference']}")
+        logger.info(f"Number of teams: {len(profile['teams'])}")
+        logger.info(f"Number of games: {len(profile['games'])}")
+        logger.info(f"Number of standings: {len(profile['standings'])}")
+        
+        # Check the format of games
+        if profile['games'] and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First game data structure:")
+            first_game = profile['games'][0]
+            if hasattr(first_game, '__dict__'):
+                logger.debug("Game is an object with attributes: %s", list(vars(first_game)))
+                logger.debug("Game __dict__: %s", first_game.__dict__)
+            else:
+                logger.debug("Game is a dictionary with keys: %s", list(first_game.keys()))
+    except Exception as e:
+        logger.error(f"Error getting profile for {conf_name}: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
 
 if __name__ == "__main__":
-    test_conference_season() 
\ No newline at end of file
+    logging.basicConfig(level=logging.DEBUG, 
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    client = get_client()
+    if client is None:
+        logger.error("No API key found in environment variables. Set CBBD_API_KEY or CFBD_API_KEY.")
+        sys.exit(1)
+    test_conference_season(client)
+    for conf_name, season in TEST_CONFERENCES:
+        test_conference_profile(client, conf_name, season) 
\ No newline at end of file
@@ -1,172 +1,222 @@
 """
-Direct API testing script.
+Direct API tests.
 
-This script makes direct API calls to test the raw responses.
+These tests exercise the teams, games and conferences endpoints end to end
+through the client, replaying recorded API responses with the responses
+library instead of calling the live API.
 """
 
 import os
-import sys
 import json
 from datetime import datetime
-from dotenv import load_dotenv
+from itertools import islice
 
-# Add the project root to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import responses
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from cbbd import CBBDClient
+from cbbd.constants import BASE_URL, Endpoints
 
-def save_json(data, name):
-    """Save data to a JSON file"""
-    output_dir = os.path.join(os.path.dirname(__file__), "results")
+SEASON = 2025
+TEAM = "Duke"
+
+
+def dump_record(record):
+    """Serialize one record to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(record, indent=2).encode()
+
+
+def save_json(records, name, output_dir=None):
+    """Save an iterable of records to a JSON array file, one record at a time"""
+    if not os.environ.get("CBBD_SAVE_ARTIFACTS"):
+        return
+
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(__file__), "results")
     os.makedirs(output_dir, exist_ok=True)
-    
+
     filename = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     filepath = os.path.join(output_dir, filename)
-    
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
-    
+
+    with open(filepath, 'wb') as f:
+        f.write(b'[')
+        for i, record in enumerate(records):
+            f.write(b',\n' if i else b'\n')
+            f.write(dump_record(record))
+        f.write(b'\n]\n')
+
     print(f"Saved to {filepath}")
 
-def test_teams_api(api_key=None, season=2023):
+
+def register(mock_responses, endpoint, data, params):
+    """Register a recorded payload for an endpoint and exact query parameters."""
+    mock_responses.add(
+        responses.GET,
+        f"{BASE_URL}{endpoint}",
+        json=data,
+        status=200,
+        match=[responses.matchers.query_param_matcher(params)]
+    )
+
+
+def test_teams_api(mock_responses, load_mock_response):
     """Test teams API"""
-    client = CBBDClient(api_key=api_key or os.getenv("CBBD_API_KEY") or os.getenv("CFBD_API_KEY"))
-    
-    print(f"\n=== Testing Teams API for season {season} ===")
-    
+    teams_data = load_mock_response('teams_2025.json')
+    conferences_to_test = ["SEC", "ACC", "Big Ten", "Big 12", "Pac-12"]
+
+    register(mock_responses, Endpoints.TEAMS, teams_data, {'season': SEASON})
+    for conf in conferences_to_test:
+        register(
+            mock_responses,
+            Endpoints.TEAMS,
+            [t for t in teams_data if t['conference'] == conf],
+            {'conference': conf, 'season': SEASON}
+        )
+
+    client = CBBDClient(api_key="mock-api-key")
+
+    print(f"\n=== Testing Teams API for season {SEASON} ===")
+
     # Get all teams
     print("\n1. Getting all teams")
-    teams = client.teams.get_teams(season=season)
+    teams = client.teams.get_teams(season=SEASON)
     print(f"Found {len(teams)} teams")
-    
-    if len(teams) > 0:
-        # Check the first team
-        team = teams[0]
-        print(f"\nFirst team: {team.name} ({team.conference})")
-        print(f"Team fields: {dir(team)}")
-        
-        # Print raw data for the first team
-        if hasattr(team, '_data'):
-            print(f"Raw data: {team._data}")
-        else:
-            print(f"Raw data: {team.__dict__}")
-        
-        # Save raw response
-        raw_data = [t._data if hasattr(t, '_data') else t.__dict__ for t in teams]
-        save_json(raw_data, f"teams_{season}")
-    
+    assert len(teams) == len(teams_data)
+
+    # Check the first team
+    team = teams[0]
+    print(f"\nFirst team: {team.name} ({team.conference})")
+    assert team.name == teams_data[0]['school']
+    assert team.conference == teams_data[0]['conference']
+
+    # Save raw response
+    raw_data = (t._data if hasattr(t, '_data') else t.__dict__ for t in teams)
+    save_json(raw_data, f"teams_{SEASON}")
+
     # Get teams by conference
-    conferences_to_test = ["SEC", "ACC", "Big Ten", "Big 12", "Pac-12"]
-    
     for conf in conferences_to_test:
         print(f"\n2. Getting teams for conference: {conf}")
-        conf_teams = client.teams.get_teams(conference=conf, season=season)
+        conf_teams = client.teams.get_teams(conference=conf, season=SEASON)
         print(f"Found {len(conf_teams)} teams for {conf}")
-        
+        assert all(t.conference == conf for t in conf_teams)
+
         if len(conf_teams) > 0:
-            team_names = [t.name for t in conf_teams]
-            print(f"Teams: {team_names}")
+            print("Teams:", ", ".join(t.name for t in conf_teams))
+
 
-def test_games_api(api_key=None, season=2023, team="Duke"):
+def test_games_api(mock_responses, load_mock_response):
     """Test games API"""
-    client = CBBDClient(api_key=api_key or os.getenv("CBBD_API_KEY") or os.getenv("CFBD_API_KEY"))
-    
-    print(f"\n=== Testing Games API for season {season} ===")
-    
+    games_data = load_mock_response('games.json')
+    team_games_data = [g for g in games_data if TEAM in (g['homeTeam'], g['awayTeam'])]
+    conferences_to_test = ["SEC", "ACC"]
+
+    register(mock_responses, Endpoints.GAMES, games_data, {'season': SEASON})
+    register(mock_responses, Endpoints.GAMES, team_games_data, {'season': SEASON, 'team': TEAM})
+    for conf in conferences_to_test:
+        register(
+            mock_responses,
+            Endpoints.GAMES,
+            [g for g in games_data if conf in (g['homeConference'], g['awayConference'])],
+            {'season': SEASON, 'conference': conf}
+        )
+
+    client = CBBDClient(api_key="mock-api-key")
+
+    print(f"\n=== Testing Games API for season {SEASON} ===")
+
     # Get all games
     print("\n1. Getting all games")
-    games = client.games.get_games(season=season)
+    games = client.games.get_games(season=SEASON)
     print(f"Found {len(games)} games")
-    
-    if len(games) > 0:
-        # Check the first game
-        game = games[0]
-        print(f"\nFirst game: {game.away_team} @ {game.home_team}")
-        print(f"Game fields: {dir(game)}")
-        
-        # Save raw response
-        raw_data = [g._data if hasattr(g, '_data') else g.__dict__ for g in games[:10]]  # Save first 10 games
-        save_json(raw_data, f"games_{season}")
-    
+    assert len(games) == len(games_data)
+
+    # Check the first game
+    game = games[0]
+    print(f"\nFirst game: {game.away_team} @ {game.home_team}")
+    assert game.home_team == games_data[0]['homeTeam']
+    assert game.away_team == games_data[0]['awayTeam']
+
+    # Save raw response
+    raw_data = (g._data if hasattr(g, '_data') else g.__dict__ for g in islice(games, 10))  # Save first 10 games
+    save_json(raw_data, f"games_{SEASON}")
+
     # Get games by team
-    print(f"\n2. Getting games for team: {team}")
-    team_games = client.games.get_games(season=season, team=team)
-    print(f"Found {len(team_games)} games for {team}")
-    
-    if len(team_games) > 0:
-        opponents = [g.away_team if g.home_team == team else g.home_team for g in team_games]
-        print(f"Opponents: {opponents}")
-    
+    print(f"\n2. Getting games for team: {TEAM}")
+    team_games = client.games.get_games(season=SEASON, team=TEAM)
+    print(f"Found {len(team_games)} games for {TEAM}")
+    assert len(team_games) == len(team_games_data)
+
+    assert all(TEAM in (g.home_team, g.away_team) for g in team_games)
+    print("Opponents:", ", ".join(g.away_team if g.home_team == TEAM else g.home_team for g in team_games))
+
     # Get games by conference
-    conferences_to_test = ["SEC", "ACC"]
-    
     for conf in conferences_to_test:
         print(f"\n3. Getting games for conference: {conf}")
-        conf_games = client.games.get_games(season=season, conference=conf)
+        conf_games = client.games.get_games(season=SEASON, conference=conf)
         print(f"Found {len(conf_games)} games for {conf}")
-        
-        if len(conf_games) > 0 and len(conf_games) < 10:
-            game_info = [(g.away_team, g.home_team, g.away_points, g.home_points) for g in conf_games]
-            print(f"Games: {game_info}")
+        assert all(conf in (g.home_conference, g.away_conference) for g in conf_games)
 
-def test_conferences_api(api_key=None):
+        if 0 < len(conf_games) < 10:
+            print("Games:", ", ".join(
+                f"{g.away_team} {g.away_points} @ {g.home_team} {g.home_points}" for g in conf_games
+            ))
+
+
+def test_conferences_api(mock_responses, load_mock_response):
     """Test conferences API"""
-    client = CBBDClient(api_key=api_key or os.getenv("CBBD_API_KEY") or os.getenv("CFBD_API_KEY"))
-    
+    conferences_data = load_mock_response('conferences.json')
+    register(mock_responses, Endpoints.CONFERENCES, conferences_data, {})
+
+    client = CBBDClient(api_key="mock-api-key")
+
     print("\n=== Testing Conferences API ===")
-    
+
     # Get all conferences
     print("\n1. Getting all conferences")
     conferences = client.conferences.get_conferences()
     print(f"Found {len(conferences)} conferences")
-    
-    if len(conferences) > 0:
-        # Print all conferences
-        conference_info = [(c.name, c.abbreviation) for c in conferences]
-        print(f"Conferences: {conference_info}")
-        
-        # Save raw response
-        raw_data = [c._data if hasattr(c, '_data') else c.__dict__ for c in conferences]
-        save_json(raw_data, "conferences")
-        
-        # Test conference matching
-        test_abbrs = ["SEC", "ACC", "Big Ten", "Big 12", "Pac-12"]
-        for abbr in test_abbrs:
-            print(f"\nLooking for conference with abbreviation: {abbr}")
-            found = False
-            for c in conferences:
-                if c.abbreviation and c.abbreviation.lower() == abbr.lower():
-                    print(f"Exact match found: {c.name} ({c.abbreviation})")
-                    found = True
-                    break
-                elif c.name and abbr.lower() in c.name.lower():
-                    print(f"Partial match found: {c.name} ({c.abbreviation})")
-                    found = True
-                    break
-            
-            if not found:
-                print(f"No match found for {abbr}")
-
-if __name__ == "__main__":
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Test API endpoints directly")
-    parser.add_argument("--season", type=int, default=2023, help="Season year")
-    parser.add_argument("--api-key", type=str, help="API key (optional, will use env var if not provided)")
-    parser.add_argument("--team", type=str, default="Duke", help="Team to test with")
-    parser.add_argument("--endpoint", type=str, choices=["teams", "games", "conferences", "all"], 
-                        default="all", help="Endpoint to test")
-    
-    args = parser.parse_args()
-    
-    if args.endpoint == "teams" or args.endpoint == "all":
-        test_teams_api(api_key=args.api_key, season=args.season)
-    
-    if args.endpoint == "games" or args.endpoint == "all":
-        test_games_api(api_key=args.api_key, season=args.season, team=args.team)
-    
-    if args.endpoint == "conferences" or args.endpoint == "all":
-        test_conferences_api(api_key=args.api_key) 
\ No newline at end of file
+    assert len(conferences) == len(conferences_data)
+
+    # Print all conferences
+    print("Conferences:", ", ".join(f"{c.name} ({c.abbreviation})" for c in conferences))
+
+    # Save raw response
+    raw_data = (c._data if hasattr(c, '_data') else c.__dict__ for c in conferences)
+    save_json(raw_data, "conferences")
+
+    # Test conference matching
+    test_abbrs = ["SEC", "ACC", "Big Ten", "Big 12", "Pac-12"]
+    by_abbr = {}
+    by_name = []
+    for c in conferences:
+        if c.abbreviation:
+            by_abbr.setdefault(c.abbreviation.lower(), c)
+        if c.name:
+            by_name.append((c.name.lower(), c))
+
+    matches = {}
+    for abbr in test_abbrs:
+        print(f"\nLooking for conference with abbreviation: {abbr}")
+        key = abbr.lower()
+        c = by_abbr.get(key)
+        if c is not None:
+            print(f"Exact match found: {c.name} ({c.abbreviation})")
+            matches[abbr] = c
+            continue
+
+        c = next((conf for name, conf in by_name if key in name), None)
+        if c is not None:
+            print(f"Partial match found: {c.name} ({c.abbreviation})")
+            matches[abbr] = c
+        else:
+            print(f"No match found for {abbr}")
+
+    assert matches["SEC"].name == "Southeastern Conference"
+    assert matches["Big Ten"].abbreviation == "Big Ten"
+    assert "Pac-12" not in matches
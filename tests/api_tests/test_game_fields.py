@@ -4,8 +4,8 @@ Test script specifically for game fields with focus on conferenceGame field.
 import os
 import sys
 import logging
+import numpy as np
 import pandas as pd
-from dotenv import load_dotenv
 from pprint import pprint
 
 # Configure logging
@@ -16,158 +16,174 @@ logger = logging.getLogger(__name__)
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-# Load environment variables from .env file
-load_dotenv()
+from tests._cache import get_profile
+from tests._env import get_client
 
-from cbbd.client import CBBDClient
+# Game fields read by the analysis below
+KNOWN_GAME_FIELDS = [
+    'id', 'season', 'seasonType', 'startDate', 'neutralSite', 'conferenceGame', 'status',
+    'homeTeamId', 'homeTeam', 'homeConferenceId', 'homeConference', 'homePoints',
+    'awayTeamId', 'awayTeam', 'awayConferenceId', 'awayConference', 'awayPoints',
+]
 
-def test_game_fields():
-    """Test game fields, particularly conferenceGame, to understand their structure and behavior."""
-    logger.info("Starting game fields test")
+def games_frame(games):
+    """
+    Build a DataFrame of games with compact dtypes.
     
-    # Initialize the client with API key from environment
-    api_key = os.getenv('CBBD_API_KEY') or os.getenv('CFBD_API_KEY')
-    if not api_key:
-        logger.error("No API key found in environment variables. Set CBBD_API_KEY or CFBD_API_KEY.")
-        return
+    conferenceGame becomes a numpy bool column with missing values treated as
+    False, and the home/away conference columns share one categorical dtype so
+    they can be compared directly.
+    """
+    games_df = pd.DataFrame.from_records(games, columns=KNOWN_GAME_FIELDS)
     
-    logger.info(f"Using API key: {api_key[:5]}..." if api_key else "No API key found")
-    client = CBBDClient(api_key=api_key)
+    games_df['conferenceGame'] = games_df['conferenceGame'].fillna(False).astype(np.bool_)
     
-    # Test with SEC conference in 2025
-    logger.info("Testing game fields for SEC conference in 2025")
-    conference = "SEC"
-    season = 2025
+    conferences = pd.unique(games_df[['homeConference', 'awayConference']].to_numpy().ravel())
+    conference_dtype = pd.CategoricalDtype([c for c in conferences if pd.notna(c)])
+    games_df['homeConference'] = games_df['homeConference'].astype(conference_dtype)
+    games_df['awayConference'] = games_df['awayConference'].astype(conference_dtype)
+    
+    return games_df
+
+def bool_counts(values):
+    """
+    Count the True and False entries of a boolean array in a single pass.
+    
+    Args:
+        values: Boolean array or Series
+        
+    Returns:
+        Dictionary mapping True and False to their counts
+    """
+    values = np.asarray(values, dtype=bool)
+    trues = int(np.count_nonzero(values))
+    return {True: trues, False: len(values) - trues}
+
+def analyze_game_fields(profile):
+    """
+    Log the structure of the game fields in a conference season profile.
+    
+    Args:
+        profile: Conference season profile dictionary from get_profile
+    """
+    # Basic validation
+    logger.info(f"Profile retrieved with {len(profile.get('games', []))} games")
     
-    # Get conference profile using the advanced API
-    logger.info(f"Getting {conference} conference profile for {season}")
-    try:
-        conference_season = client.advanced.conference_season
-        profile = conference_season.get_profile(conference, season)
+    # Create DataFrame from games for analysis
+    if 'games' in profile and profile['games']:
+        games_df = games_frame(profile['games'])
+        logger.info(f"Created DataFrame with {len(games_df)} games")
         
-        # Basic validation
-        logger.info(f"Profile retrieved with {len(profile.get('games', []))} games")
+        # Pull the arrays every step below works on out of the DataFrame once
+        conf_game_mask = games_df['conferenceGame'].to_numpy()
+        home_codes = games_df['homeConference'].cat.codes.to_numpy()
+        away_codes = games_df['awayConference'].cat.codes.to_numpy()
+        same_conf_mask = (home_codes == away_codes) & (home_codes >= 0)
+        matchups = games_df[['awayTeam', 'homeTeam']]
         
-        # Create DataFrame from games for analysis
-        if 'games' in profile and profile['games']:
-            games_df = pd.DataFrame(profile['games'])
-            logger.info(f"Created DataFrame with {len(games_df)} games")
+        # 1. Check if conferenceGame field exists
+        logger.info(f"DataFrame columns: {list(games_df.columns)}")
+        missing_conference_game = sum(game.get('conferenceGame') is None for game in profile['games'])
+        has_conference_game = missing_conference_game < len(games_df)
+        logger.info(f"Has conferenceGame field: {has_conference_game}")
+        
+        if has_conference_game:
+            # 2. Check the data type of conferenceGame field
+            logger.info(f"conferenceGame dtype: {games_df['conferenceGame'].dtype}")
             
-            # 1. Check if conferenceGame field exists
-            logger.info(f"DataFrame columns: {list(games_df.columns)}")
-            has_conference_game = 'conferenceGame' in games_df.columns
-            logger.info(f"Has conferenceGame field: {has_conference_game}")
+            # 3. Check value distribution
+            value_counts = bool_counts(conf_game_mask)
+            logger.info(f"conferenceGame value counts: {value_counts}")
             
-            if has_conference_game:
-                # 2. Check the data type of conferenceGame field
-                logger.info(f"conferenceGame dtype: {games_df['conferenceGame'].dtype}")
-                
-                # 3. Check value distribution
-                value_counts = games_df['conferenceGame'].value_counts().to_dict()
-                logger.info(f"conferenceGame value counts: {value_counts}")
-                
-                # 4. Check for NaN values
-                nan_count = games_df['conferenceGame'].isna().sum()
-                logger.info(f"NaN values in conferenceGame: {nan_count}")
-                
-                # 5. Get unique values
-                unique_values = games_df['conferenceGame'].unique()
-                logger.info(f"Unique values in conferenceGame: {unique_values}")
+            # 4. Check for missing values (counted as False in the DataFrame)
+            logger.info(f"Missing values in conferenceGame: {missing_conference_game}")
+            
+            # 5. Get unique values
+            unique_values = [value for value, count in value_counts.items() if count]
+            logger.info(f"Unique values in conferenceGame: {unique_values}")
+            
+            # 6. Check sample values
+            logger.info("Sample conferenceGame values:")
+            for i, conference_game in enumerate(conf_game_mask[:5].tolist()):
+                logger.info(f"Game {i} - conferenceGame: {conference_game} - Type: {type(conference_game)}")
+            
+            # 7. Test boolean conversion
+            logger.info("Testing boolean conversion:")
+            try:
+                # Try direct conversion
+                conference_game_bool = conf_game_mask.astype(bool)
+                logger.info(f"Direct bool conversion result counts: {bool_counts(conference_game_bool)}")
                 
-                # 6. Check sample values
-                logger.info("Sample conferenceGame values:")
-                for i, game in games_df.head(5).iterrows():
-                    logger.info(f"Game {i} - conferenceGame: {game['conferenceGame']} - Type: {type(game['conferenceGame'])}")
+                # Try explicit True comparison
+                conference_game_is_true = np.equal(conf_game_mask, True)
+                logger.info(f"Explicit == True comparison counts: {bool_counts(conference_game_is_true)}")
                 
-                # 7. Test boolean conversion
-                logger.info("Testing boolean conversion:")
+                # Try int conversion first then bool
                 try:
-                    # Try direct conversion
-                    games_df['conferenceGame_bool'] = games_df['conferenceGame'].astype(bool)
-                    logger.info(f"Direct bool conversion result counts: {games_df['conferenceGame_bool'].value_counts().to_dict()}")
-                    
-                    # Try explicit True comparison
-                    games_df['conferenceGame_is_true'] = games_df['conferenceGame'] == True
-                    logger.info(f"Explicit == True comparison counts: {games_df['conferenceGame_is_true'].value_counts().to_dict()}")
-                    
-                    # Try various mappings
-                    # Method 1: Map string values
-                    if games_df['conferenceGame'].dtype == 'object':
-                        mapping = {True: True, 'True': True, 'true': True, 
-                                  False: False, 'False': False, 'false': False}
-                        games_df['conferenceGame_mapped'] = games_df['conferenceGame'].map(mapping)
-                        logger.info(f"String mapping conversion counts: {games_df['conferenceGame_mapped'].value_counts().to_dict()}")
-                    
-                    # Method 2: Try int conversion first then bool
-                    try:
-                        games_df['conferenceGame_int_bool'] = games_df['conferenceGame'].astype(int).astype(bool)
-                        logger.info(f"Int->Bool conversion counts: {games_df['conferenceGame_int_bool'].value_counts().to_dict()}")
-                    except Exception as e:
-                        logger.info(f"Int->Bool conversion failed: {str(e)}")
-                    
+                    conference_game_int_bool = conf_game_mask.astype(int).astype(bool)
+                    logger.info(f"Int->Bool conversion counts: {bool_counts(conference_game_int_bool)}")
                 except Exception as e:
-                    logger.error(f"Error during boolean conversion: {str(e)}")
-                
-                # 8. Count conference games using different methods
-                logger.info("Counting conference games using different methods:")
-                
-                # Method 1: Direct True comparison
-                true_count = (games_df['conferenceGame'] == True).sum()
-                logger.info(f"Count using == True: {true_count}")
-                
-                # Method 2: Boolean conversion
-                bool_count = games_df['conferenceGame'].astype(bool).sum()
-                logger.info(f"Count using .astype(bool).sum(): {bool_count}")
+                    logger.info(f"Int->Bool conversion failed: {str(e)}")
                 
-                # Method 3: Using .eq and sum
-                eq_count = games_df['conferenceGame'].eq(True).sum()
-                logger.info(f"Count using .eq(True).sum(): {eq_count}")
-                
-                # 9. Examine sample conference games
-                logger.info("Sample of games where conferenceGame is True:")
-                conf_games = games_df[games_df['conferenceGame'] == True]
-                for i, game in conf_games.head(3).iterrows():
-                    logger.info(f"Game {i}: {game['awayTeam']} @ {game['homeTeam']}")
+            except Exception as e:
+                logger.error(f"Error during boolean conversion: {str(e)}")
+            
+            # 8. Count conference games using different methods
+            logger.info("Counting conference games using different methods:")
+            
+            # The column is numpy bool, so the mask sum is the conference game count
+            true_count = int(np.count_nonzero(conf_game_mask))
+            logger.info(f"Count of conference games: {true_count}")
+            
+            # 9. Examine sample conference games
+            logger.info("Sample of games where conferenceGame is True:")
+            conf_games = matchups.take(np.flatnonzero(conf_game_mask)[:3])
+            for i, away_team, home_team in conf_games.itertuples(index=True, name=None):
+                logger.info(f"Game {i}: {away_team} @ {home_team}")
+            
+            # 10. Examine the home/away conference fields
+            if 'homeConference' in games_df.columns and 'awayConference' in games_df.columns:
+                logger.info("Examining home/away conference fields")
+                # Count games where both teams are from the same conference
+                same_conf_count = int(np.count_nonzero(same_conf_mask))
+                logger.info(f"Games with same home/away conference: {same_conf_count}")
                 
-                # 10. Examine the home/away conference fields
-                if 'homeConference' in games_df.columns and 'awayConference' in games_df.columns:
-                    logger.info("Examining home/away conference fields")
-                    # Count games where both teams are from the same conference
-                    same_conf_count = (games_df['homeConference'] == games_df['awayConference']).sum()
-                    logger.info(f"Games with same home/away conference: {same_conf_count}")
+                # Compare with conferenceGame field
+                if same_conf_count != true_count:
+                    logger.warning(f"Mismatch between same conference count ({same_conf_count}) and conferenceGame true count ({true_count})")
                     
-                    # Compare with conferenceGame field
-                    if same_conf_count != true_count:
-                        logger.warning(f"Mismatch between same conference count ({same_conf_count}) and conferenceGame true count ({true_count})")
-                        
-                        # Check for discrepancies
-                        same_conf_mask = games_df['homeConference'] == games_df['awayConference']
-                        conf_game_mask = games_df['conferenceGame'] == True
-                        
-                        # Games that are conference games but teams aren't from same conference
-                        conf_game_but_diff_conf = games_df[conf_game_mask & ~same_conf_mask]
-                        logger.info(f"Games marked as conference but teams from different conferences: {len(conf_game_but_diff_conf)}")
-                        
-                        # Games that aren't conference games but teams are from same conference
-                        same_conf_but_not_conf_game = games_df[same_conf_mask & ~conf_game_mask]
-                        logger.info(f"Games with teams from same conference but not marked as conference: {len(same_conf_but_not_conf_game)}")
-            else:
-                logger.warning("conferenceGame field not found in the DataFrame")
-                
-                # Check home/away conference fields as alternative
-                if 'homeConference' in games_df.columns and 'awayConference' in games_df.columns:
-                    # Count games where both teams are from the same conference
-                    same_conf_count = (games_df['homeConference'] == games_df['awayConference']).sum()
-                    logger.info(f"Games with same home/away conference: {same_conf_count}")
+                    # Games that are conference games but teams aren't from same conference
+                    conf_game_but_diff_conf = conf_game_mask & ~same_conf_mask
+                    logger.info(f"Games marked as conference but teams from different conferences: {np.count_nonzero(conf_game_but_diff_conf)}")
+                    
+                    # Games that aren't conference games but teams are from same conference
+                    same_conf_but_not_conf_game = same_conf_mask & ~conf_game_mask
+                    logger.info(f"Games with teams from same conference but not marked as conference: {np.count_nonzero(same_conf_but_not_conf_game)}")
+                    
+                    sample = matchups.take(np.flatnonzero(conf_game_but_diff_conf)[:5])
+                    for i, away_team, home_team in sample.itertuples(index=True, name=None):
+                        logger.info(f"Conference game across conferences {i}: {away_team} @ {home_team}")
         else:
-            logger.warning("No games found in the profile")
+            logger.warning("conferenceGame field not found in the DataFrame")
             
-    except Exception as e:
-        logger.error(f"Error testing game fields: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+            # Check home/away conference fields as alternative
+            if 'homeConference' in games_df.columns and 'awayConference' in games_df.columns:
+                # Count games where both teams are from the same conference
+                same_conf_count = int(np.count_nonzero(same_conf_mask))
+                logger.info(f"Games with same home/away conference: {same_conf_count}")
+    else:
+        logger.warning("No games found in the profile")
+
+def test_game_fields(sec_2025_profile):
+    """Test game fields, particularly conferenceGame, to understand their structure and behavior."""
+    logger.info("Starting game fields test")
+    
+    # Test with SEC conference in 2025, from the recorded profile unless it is missing
+    logger.info("Testing game fields for SEC conference in 2025")
+    assert sec_2025_profile['games']
+    analyze_game_fields(sec_2025_profile)
     
     logger.info("Game fields test completed")
 
 if __name__ == "__main__":
-    test_game_fields() 
\ No newline at end of file
+    test_game_fields(get_profile(get_client(), 'SEC', 2025))
\ No newline at end of file
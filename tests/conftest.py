@@ -3,45 +3,154 @@ Pytest configuration for the CBBD Python SDK tests.
 """
 
 import os
+import copy
+import functools
 import pytest
+import requests
 import responses
 import json
 from pathlib import Path
-from dotenv import load_dotenv
 from unittest.mock import MagicMock, patch
 
-from cbbd import CBBDClient
-from cbbd.constants import BASE_URL
-
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# API key for testing
-API_KEY = os.getenv('CBBD_API_KEY')
+from cbbd import CBBDClient
+from cbbd.constants import BASE_URL, Endpoints
+from tests._cache import get_profile, profile_path
+from tests._env import get_client
+from tests.stubs import (
+    GameStub, PollStub, RankingStub, RankStub, RatingStub, RosterStub, TeamStatsStub, TeamStub
+)
 
 # Directory for mock responses
 MOCK_RESPONSE_DIR = Path(__file__).parent / 'mock_responses'
 
+# Endpoints pre-registered by the responses_mock fixture as
+# (endpoint, response file, query parameters)
+MOCK_ENDPOINTS = [
+    (Endpoints.TEAMS, 'teams.json', {}),
+    (Endpoints.TEAMS, 'teams.json', {'conference': 'ACC', 'season': 2023}),
+    (Endpoints.TEAMS_ROSTER, 'team_roster.json', {'team': 'Duke', 'season': 2023}),
+]
 
-@pytest.fixture
-def client():
+# SQLite file and lifetime (12 hours) for the opt-in HTTP cache
+REQUESTS_CACHE_PATH = '.cache/requests-cache.sqlite'
+REQUESTS_CACHE_EXPIRE_AFTER = 43200
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        default=False,
+        help="Cache live API responses in a local SQLite file for 12 hours"
+    )
+    parser.addoption(
+        "--save-artifacts",
+        action="store_true",
+        default=False,
+        help="Save raw API responses from the API tests to tests/api_tests/results"
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers, export --save-artifacts and check the HTTP cache is available."""
+    config.addinivalue_line(
+        "markers", "integration: tests that call the live API"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a name on one pytest-xdist worker"
+    )
+    
+    if config.getoption("--save-artifacts"):
+        os.environ["CBBD_SAVE_ARTIFACTS"] = "1"
+    
+    if config.getoption("--use-requests-cache"):
+        try:
+            import requests_cache  # noqa: F401
+        except ImportError:
+            raise pytest.UsageError(
+                "--use-requests-cache requires the requests-cache package"
+            )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cache(request):
+    """
+    Install a requests-cache session when --use-requests-cache is given.
+    
+    Repeated local runs of the integration tests then replay cached API
+    responses instead of going back to the network. The cache is installed
+    for the whole session so that session-scoped clients pick it up too.
+    """
+    if not request.config.getoption("--use-requests-cache"):
+        yield
+        return
+    
+    import requests_cache
+    
+    Path(REQUESTS_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+    requests_cache.install_cache(
+        REQUESTS_CACHE_PATH,
+        backend="sqlite",
+        expire_after=REQUESTS_CACHE_EXPIRE_AFTER
+    )
+    yield
+    requests_cache.uninstall_cache()
+
+
+@pytest.fixture(scope="session")
+def client(live_client):
     """
     Fixture for a real client instance with API key.
     
-    Use this for integration tests against the real API.
+    Use this for integration tests against the real API. It is the
+    session-wide live_client, so no session or cache is rebuilt per test.
+    """
+    return live_client
+
+
+@pytest.fixture(scope="session")
+def live_client():
+    """
+    Fixture for a real client shared by every test in the session.
+    
+    The client comes from tests._env.get_client, so its keep-alive session
+    is reused across all endpoint calls.
     """
-    if not API_KEY:
+    live = get_client()
+    if live is None:
         pytest.skip("No API key available for integration tests")
     
-    return CBBDClient(api_key=API_KEY)
+    yield live
+    live.session.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sec_2025_profile(request):
+    """
+    Fixture for the SEC 2025 conference season profile.
+    
+    The profile recorded in tests/mock_responses is used when present, so no
+    API key or network access is needed. Otherwise it is fetched once with
+    the live client and recorded there.
+    """
+    if profile_path('SEC', 2025).exists():
+        return get_profile(None, 'SEC', 2025)
+    return get_profile(request.getfixturevalue('live_client'), 'SEC', 2025)
+
+
+@pytest.fixture(scope="module")
 def mock_client():
     """
     Fixture for a mock client instance.
     
     This client does not make real API calls but uses mocked responses.
+    It is shared by the tests in a module since none of them mutate it.
     """
     with patch('cbbd.api.base.create_http_client'):
         client = CBBDClient(api_key='mock-api-key')
@@ -49,6 +158,20 @@ def mock_client():
         return client
 
 
+@functools.lru_cache(maxsize=None)
+def _query_param_matcher(params):
+    """
+    Build a query parameter matcher once per distinct set of parameters.
+    
+    Args:
+        params: frozenset of (name, value) query parameter pairs
+        
+    Returns:
+        A responses matcher for exactly those query parameters
+    """
+    return responses.matchers.query_param_matcher(dict(params))
+
+
 @pytest.fixture
 def mock_responses():
     """
@@ -60,30 +183,73 @@ def mock_responses():
         yield rsps
 
 
+@pytest.fixture(scope="module")
+def responses_mock(mock_client, mock_payloads):
+    """
+    Fixture for mock API responses shared by every test in a module.
+    
+    All MOCK_ENDPOINTS are registered once, and the mock client is given a
+    real requests.Session so its calls are answered by the registered
+    responses until the module finishes.
+    
+    Returns the active responses.RequestsMock.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for endpoint, response_file, params in MOCK_ENDPOINTS:
+            rsps.add(
+                responses.GET,
+                f"{BASE_URL}{endpoint}",
+                json=mock_payloads[response_file],
+                status=200,
+                match=[_query_param_matcher(frozenset(params.items()))]
+            )
+        
+        mock_session = mock_client.session
+        mock_client.session = requests.Session()
+        yield rsps
+        mock_client.session.close()
+        mock_client.session = mock_session
+
+
+@pytest.fixture(scope="session")
+def mock_payloads():
+    """
+    Fixture for the decoded mock responses.
+    
+    Every JSON file in the mock_responses directory is read and parsed
+    once per test session, with orjson when it is installed.
+    
+    Returns a dict mapping file names to the loaded JSON data.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    return {
+        file_path.name: loads(file_path.read_bytes())
+        for file_path in MOCK_RESPONSE_DIR.glob('*.json')
+    }
+
+
 @pytest.fixture
-def load_mock_response():
+def load_mock_response(mock_payloads):
     """
     Fixture for loading mock responses from JSON files.
     
-    Returns a function that loads and returns mock response data.
+    Returns a function that returns mock response data.
     """
     def _load_mock_response(filename):
         """
-        Load mock response data from a JSON file.
+        Load mock response data from the session payload cache.
         
         Args:
             filename: Name of the JSON file in the mock_responses directory
             
         Returns:
-            The loaded JSON data
+            A deep copy of the loaded JSON data, so changes made by one test
+            never reach the session cache or later tests
         """
-        file_path = MOCK_RESPONSE_DIR / filename
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"Mock response file not found: {file_path}")
+        if filename not in mock_payloads:
+            raise FileNotFoundError(f"Mock response file not found: {MOCK_RESPONSE_DIR / filename}")
         
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return copy.deepcopy(mock_payloads[filename])
     
     return _load_mock_response
 
@@ -94,7 +260,11 @@ def register_mock_endpoints(mock_responses, load_mock_response):
     Fixture for registering mock endpoints with the responses library.
     
     Returns a function that registers a mock endpoint for testing.
+    Registering the same endpoint, status and parameters again within a
+    test is a no-op.
     """
+    registered = {}
+    
     def _register_mock_endpoint(endpoint, response_file, status=200, params=None):
         """
         Register a mock endpoint for testing.
@@ -109,6 +279,11 @@ def register_mock_endpoints(mock_responses, load_mock_response):
             The registered mock response
         """
         url = f"{BASE_URL}{endpoint}"
+        params_key = frozenset((params or {}).items())
+        key = (url, response_file, status, params_key)
+        if key in registered:
+            return registered[key]
+        
         mock_data = load_mock_response(response_file)
         
         # Add the mock endpoint
@@ -117,9 +292,47 @@ def register_mock_endpoints(mock_responses, load_mock_response):
             url,
             json=mock_data,
             status=status,
-            match=[responses.matchers.query_param_matcher(params or {})]
+            match=[_query_param_matcher(params_key)]
         )
         
+        registered[key] = mock_data
         return mock_data
     
-    return _register_mock_endpoint 
\ No newline at end of file
+    return _register_mock_endpoint
+
+
+@pytest.fixture
+def team_profile_mocks(mock_client, monkeypatch, team, season):
+    """
+    Fixture for a mock client wired up for a TeamSeasonProfile.
+    
+    Tests using it parametrize ``team`` and ``season``. The teams, games,
+    stats, rankings and ratings namespaces of the shared mock client are
+    replaced with MagicMocks for the duration of one test, returning
+    dataclass stubs in place of the SDK models.
+    
+    Returns the configured mock client.
+    """
+    teams = MagicMock()
+    teams.get_teams.return_value = [TeamStub(id=1, name=team, conference='ACC')]
+    teams.get_roster.return_value = RosterStub(team_id=1, team=team, season=season, players=[])
+    games = MagicMock()
+    games.get_games.return_value = [GameStub(id=1, home_team=team, away_team='Opponent')]
+    stats = MagicMock()
+    stats.get_team_stats.return_value = [TeamStatsStub(team=team, points=80)]
+    rankings = MagicMock()
+    rankings.get_rankings.return_value = [RankingStub(
+        week=1,
+        polls=[PollStub(poll='AP Top 25', ranks=[RankStub(school=team, rank=1)])]
+    )]
+    ratings = MagicMock()
+    ratings.get_srs_ratings.return_value = [RatingStub(team=team, rating=10.5)]
+    ratings.get_adjusted_ratings.return_value = []
+    
+    monkeypatch.setattr(mock_client, 'teams', teams)
+    monkeypatch.setattr(mock_client, 'games', games)
+    monkeypatch.setattr(mock_client, 'stats', stats)
+    monkeypatch.setattr(mock_client, 'rankings', rankings)
+    monkeypatch.setattr(mock_client, 'ratings', ratings)
+    
+    return mock_client
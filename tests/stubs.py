@@ -0,0 +1,104 @@
+"""
+Lightweight model stubs for unit tests.
+
+These dataclasses mirror the attributes and to_dict() method that the
+advanced modules read from the SDK models, without the overhead of
+MagicMock attribute trees.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
+
+
+class _Stub:
+    """Base class providing to_dict() for the model stubs."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the stub to a dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class TeamStub(_Stub):
+    """Stub for cbbd.models.team.Team."""
+
+    __slots__ = ('id', 'name', 'conference')
+
+    id: int
+    name: str
+    conference: str
+
+
+@dataclass
+class RosterStub(_Stub):
+    """Stub for cbbd.models.team.TeamRoster."""
+
+    __slots__ = ('team_id', 'team', 'season', 'players')
+
+    team_id: int
+    team: str
+    season: int
+    players: List[Any]
+
+
+@dataclass
+class GameStub(_Stub):
+    """Stub for cbbd.models.game.Game."""
+
+    __slots__ = ('id', 'home_team', 'away_team')
+
+    id: int
+    home_team: str
+    away_team: str
+
+
+@dataclass
+class TeamStatsStub(_Stub):
+    """Stub for team season stats."""
+
+    __slots__ = ('team', 'points')
+
+    team: str
+    points: int
+
+
+@dataclass
+class RatingStub(_Stub):
+    """Stub for SRS and adjusted efficiency ratings."""
+
+    __slots__ = ('team', 'rating')
+
+    team: str
+    rating: float
+
+
+@dataclass
+class RankStub(_Stub):
+    """Stub for a single team's rank within a poll."""
+
+    __slots__ = ('school', 'rank')
+
+    school: str
+    rank: int
+
+
+@dataclass
+class PollStub(_Stub):
+    """Stub for a poll with its ranked teams."""
+
+    __slots__ = ('poll', 'ranks')
+
+    poll: str
+    ranks: List[RankStub]
+
+
+@dataclass
+class RankingStub(_Stub):
+    """Stub for a week of rankings across polls."""
+
+    __slots__ = ('week', 'polls')
+
+    week: int
+    polls: List[PollStub]
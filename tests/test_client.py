@@ -40,6 +40,20 @@ class TestCBBDClient:
         
         client = CBBDClient(api_key="test-api-key", cache_ttl=600)
         assert client.cache_ttl == 600
+        assert client.cache.ttl == 600
+    
+    def test_init_with_shared_cache(self):
+        """Test initialization with the shared cache."""
+        with patch("cbbd.utils.cache._shared_cache", None):
+            client = CBBDClient(api_key="test-api-key", shared_cache=True)
+            client.cache["key"] = "value"
+            
+            # The API key is scoped by its digest, never stored as is
+            assert "test-api-key" not in repr(client.cache.cache)
+            
+            # A conflicting TTL names the setting
+            with pytest.raises(ValueError, match="cache_ttl=600"):
+                CBBDClient(api_key="test-api-key", cache_ttl=600, shared_cache=True)
     
     def test_init_with_logging_options(self):
         """Test initialization with logging options."""
@@ -0,0 +1,45 @@
+"""
+Tests for the Streamlit app's record-based DataFrame builders.
+"""
+
+from cbbd.models.line import Line
+from cbbd.models.play import Play
+from streamlit_app.frames import LINE_COLUMNS, PLAY_COLUMNS, PLAY_FALLBACK_KEYS, records_frame
+
+
+class TestRecordsFrame:
+    """Tests for records_frame."""
+    
+    def test_line_columns(self):
+        """Test a Line-shaped record maps onto the lines table columns."""
+        record = {
+            "game_id": 1,
+            "home_team": "Duke",
+            "away_team": "UNC",
+            "provider": "ESPN BET",
+            "spread": -4.5,
+            "over_under": 151.5,
+            "home_moneyline": -200,
+            "away_moneyline": 170,
+        }
+        
+        df = records_frame([Line(record)], LINE_COLUMNS)
+        
+        assert list(df.columns) == [
+            "Game ID", "Home Team", "Away Team", "Provider", "Spread",
+            "Over/Under", "Home Moneyline", "Away Moneyline"
+        ]
+        assert df.iloc[0].tolist() == list(record.values())
+    
+    def test_play_fallback_keys(self):
+        """Test snake_case play keys fill in missing camelCase keys."""
+        plays = [
+            Play({"gameId": 1, "homeScore": 2, "awayScore": 0}),
+            Play({"game_id": 2, "home_score": 5, "away_score": 4}),
+        ]
+        
+        df = records_frame(plays, PLAY_COLUMNS, PLAY_FALLBACK_KEYS)
+        
+        assert df["Game ID"].tolist() == [1, 2]
+        assert df["Home Score"].tolist() == [2, 5]
+        assert df["Away Score"].tolist() == [0, 4]
@@ -97,6 +97,39 @@ class TestBaseTransformer(unittest.TestCase):
             "toplevel": "top"
         }
         self.assertEqual(flattened_custom, expected_custom)
+        
+        # Test with a parent key prefix
+        flattened_prefixed = BaseTransformer.flatten_dict({"a": {"b": 1}, "c": 2}, parent_key="root")
+        self.assertEqual(list(flattened_prefixed.items()), [("root_a_b", 1), ("root_c", 2)])
+        
+        # Test nesting deeper than the recursion limit
+        deep = "leaf"
+        for _ in range(2000):
+            deep = {"k": deep}
+        flattened_deep = BaseTransformer.flatten_dict(deep)
+        self.assertEqual(list(flattened_deep.values()), ["leaf"])
+    
+    def test_mask_null_strings(self):
+        """Test masking NULL strings across a DataFrame."""
+        df = pd.DataFrame({
+            "city": ["Durham", "NULL", "null"],
+            "state": ["NC", "Null", None],
+            "jersey": [1, 2, 3],
+            "fips": [37063, 1, 2]
+        })
+        df["fips"] = df["fips"].astype(object)
+        
+        result = BaseTransformer.mask_null_strings(df)
+        
+        self.assertEqual(result.iloc[0]["city"], "Durham")
+        self.assertTrue(result["city"].iloc[1:].isna().all())
+        self.assertEqual(result["state"].iloc[0], "NC")
+        self.assertTrue(result["state"].iloc[1:].isna().all())
+        self.assertEqual(result["jersey"].tolist(), [1, 2, 3])
+        self.assertEqual(result["fips"].tolist(), [37063, 1, 2])
+        
+        # The input frame is left untouched
+        self.assertEqual(df["city"].tolist(), ["Durham", "NULL", "null"])
 
 
 class TestRosterTransformer(unittest.TestCase):
@@ -228,7 +261,38 @@ class TestDataFrameUtils(unittest.TestCase):
         # Verify date conversion
         self.assertTrue(pd.api.types.is_datetime64_dtype(result['date']))
         self.assertTrue(pd.isna(result.iloc[2]['date']))
-    
+
+    def test_make_visualization_ready_multiple_columns(self):
+        """Test make_visualization_ready converts several columns per type and skips missing ones."""
+        # Create test data
+        data = {
+            'points': ['70', 'NULL', '81'],
+            'rebounds': [30, 35, 41],
+            'conference': ['ACC', 'SEC', 'NULL'],
+            'position': ['G', 'F', 'G']
+        }
+        df = pd.DataFrame(data)
+
+        # Run the method
+        result = DataFrameUtils.make_visualization_ready(
+            df,
+            numeric_columns=['points', 'rebounds', 'missing'],
+            categorical_columns=['conference', 'position']
+        )
+
+        # Verify numeric conversion
+        self.assertTrue(pd.api.types.is_numeric_dtype(result['points']))
+        self.assertTrue(pd.isna(result.iloc[1]['points']))
+        self.assertEqual(result['rebounds'].tolist(), [30, 35, 41])
+        self.assertNotIn('missing', result.columns)
+
+        # Verify each categorical column keeps its own categories
+        self.assertEqual(list(result['conference'].cat.categories), ['ACC', 'SEC'])
+        self.assertEqual(list(result['position'].cat.categories), ['F', 'G'])
+
+        # Verify the input is left untouched
+        self.assertEqual(df.iloc[1]['points'], 'NULL')
+
     def test_add_calculated_columns(self):
         """Test add_calculated_columns method."""
         # Create test data
@@ -260,7 +324,8 @@ class TestDataFrameUtils(unittest.TestCase):
         data = {
             'playerName': ['Player 1', 'Player 2'],
             'TeamId': [1, 2],
-            'seasonType': ['Regular', 'Postseason']
+            'seasonType': ['Regular', 'Postseason'],
+            'gameID': [10, 11]
         }
         df = pd.DataFrame(data)
         
@@ -271,6 +336,7 @@ class TestDataFrameUtils(unittest.TestCase):
         self.assertIn('player_name', result.columns)
         self.assertIn('team_id', result.columns)
         self.assertIn('season_type', result.columns)
+        self.assertIn('game_id', result.columns)
         
         # Verify data preservation
         self.assertEqual(result.iloc[0]['player_name'], 'Player 1')
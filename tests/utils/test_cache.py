@@ -4,9 +4,13 @@ Tests for the cache utilities.
 
 import pytest
 import time
-from unittest.mock import MagicMock, call
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
 
+from cbbd.models.team import TeamList
 from cbbd.utils.cache import (
+    CACHE_MAX_VALUE_ITEMS,
     create_cache,
     generate_cache_key,
     cached
@@ -28,25 +32,51 @@ class TestCache:
         assert cache.maxsize == 256
         assert cache.ttl == 600
     
+    def test_create_shared_cache(self):
+        """Test create_cache shares entries only between clients with the same scope."""
+        with patch("cbbd.utils.cache._shared_cache", None):
+            cache = create_cache(shared=True, scope=("url", "key1"))
+            same = create_cache(shared=True, scope=("url", "key1"))
+            other = create_cache(shared=True, scope=("url", "key2"))
+            
+            cache["k"] = "v"
+            assert same["k"] == "v"
+            assert "k" not in other
+            assert len(other) == 0
+            
+            # Clearing one scope leaves the others in place
+            other["k"] = "w"
+            cache.clear()
+            assert "k" not in same
+            assert other["k"] == "w"
+            
+            # A different size or TTL cannot be applied to the existing cache
+            with pytest.raises(ValueError):
+                create_cache(ttl=60, shared=True, scope=("url", "key1"))
+    
     def test_generate_cache_key(self):
         """Test generate_cache_key function."""
         # Test with function name only
         key1 = generate_cache_key("test_func", (), {})
-        assert isinstance(key1, str)
+        assert isinstance(key1, tuple)
+        hash(key1)
         
         # Test with positional arguments
         key2 = generate_cache_key("test_func", (1, "two", 3.0), {})
-        assert isinstance(key2, str)
+        assert isinstance(key2, tuple)
+        hash(key2)
         assert key1 != key2
         
         # Test with keyword arguments
         key3 = generate_cache_key("test_func", (), {"a": 1, "b": "two"})
-        assert isinstance(key3, str)
+        assert isinstance(key3, tuple)
+        hash(key3)
         assert key1 != key3
         
         # Test with positional and keyword arguments
         key4 = generate_cache_key("test_func", (1, "two"), {"a": 1, "b": "two"})
-        assert isinstance(key4, str)
+        assert isinstance(key4, tuple)
+        hash(key4)
         assert key1 != key4
         
         # Test same arguments produce same key
@@ -57,14 +87,34 @@ class TestCache:
         key6 = generate_cache_key("test_func", (1, "two"), {"b": "two", "a": 1})
         assert key4 == key6
     
+    def test_cache_key_no_collision(self):
+        """Test generate_cache_key gives distinct keys for distinct calls."""
+        calls = [
+            ("test_func", (), {}),
+            ("other_func", (), {}),
+            ("test_func", (1,), {}),
+            ("test_func", ("1",), {}),
+            ("test_func", (None,), {}),
+            ("test_func", (1, 2), {}),
+            ("test_func", ((1, 2),), {}),
+            ("test_func", ("a", 1), {}),
+            ("test_func", (), {"a": 1}),
+            ("test_func", (), {"a": "1"}),
+            ("test_func", (), {"a": 1, "b": 2}),
+            ("test_func", (1,), {"a": 1}),
+        ]
+        calls.extend(("test_func", (season,), {"team": team})
+                     for season in range(2000, 2025) for team in ("Duke", "UNC", "Kentucky"))
+        
+        keys = {generate_cache_key(*call) for call in calls}
+        assert len(keys) == len(calls)
+    
     def test_cached_decorator(self):
         """Test cached decorator."""
         # Create a mock class similar to API classes
         class TestAPI:
             def __init__(self):
-                self.client = MagicMock()
-                self.client.use_cache = True
-                self.client.cache = {}
+                self.client = SimpleNamespace(use_cache=True, cache=create_cache())
                 self.counter = 0
             
             @cached
@@ -92,13 +142,127 @@ class TestCache:
         assert api.counter == 2
         assert len(api.client.cache) == 2
     
+    def test_cached_decorator_normalizes_arguments(self):
+        """Test cached decorator keys positional, keyword and default arguments alike."""
+        class TestAPI:
+            def __init__(self):
+                self.client = SimpleNamespace(use_cache=True, cache=create_cache())
+                self.counter = 0
+            
+            @cached
+            def test_method(self, team, season=None):
+                """Test method."""
+                self.counter += 1
+                return (team, season)
+        
+        api = TestAPI()
+        
+        assert api.test_method("Duke") == ("Duke", None)
+        assert api.test_method("Duke", None) == ("Duke", None)
+        assert api.test_method(team="Duke", season=None) == ("Duke", None)
+        assert api.counter == 1
+        assert (TestAPI.test_method.__qualname__, ("Duke", None)) in api.client.cache
+        assert TestAPI.test_method.__name__ == "test_method"
+        assert TestAPI.test_method.__doc__ == "Test method."
+    
+    def test_cached_decorator_with_eviction(self):
+        """Test cached decorator with a bounded cache."""
+        # Create a mock class with a two-entry cache
+        class TestAPI:
+            def __init__(self):
+                self.client = SimpleNamespace(use_cache=True, cache=create_cache(maxsize=2, ttl=60))
+                self.counter = 0
+            
+            @cached
+            def test_method(self, arg1):
+                self.counter += 1
+                return arg1
+        
+        api = TestAPI()
+        
+        # Three distinct calls leave only the two most recent cached
+        for arg in ("value1", "value2", "value3"):
+            api.test_method(arg)
+        assert len(api.client.cache) == 2
+        assert api.counter == 3
+        
+        # The evicted call executes again, the retained one is cached
+        api.test_method("value3")
+        assert api.counter == 3
+        api.test_method("value1")
+        assert api.counter == 4
+    
+    def test_cached_decorator_with_unhashable_args(self):
+        """Test cached decorator skips caching for unhashable arguments."""
+        # Create a mock class similar to API classes
+        class TestAPI:
+            def __init__(self):
+                self.client = SimpleNamespace(use_cache=True, cache={})
+                self.counter = 0
+            
+            @cached
+            def test_method(self, teams):
+                self.counter += 1
+                return len(teams)
+        
+        api = TestAPI()
+        
+        # Calls with a list argument should always execute the method
+        assert api.test_method(["Duke", "UNC"]) == 2
+        assert api.test_method(["Duke", "UNC"]) == 2
+        assert api.counter == 2
+        
+        # Unhashable keyword arguments are not cached either
+        assert api.test_method(teams=["Duke"]) == 1
+        assert api.counter == 3
+        assert len(api.client.cache) == 0
+    
+    def test_cached_decorator_skips_large_results(self):
+        """Test cached decorator does not store results over the size limit."""
+        class TestAPI:
+            def __init__(self):
+                self.client = SimpleNamespace(use_cache=True, cache=create_cache())
+                self.counter = 0
+            
+            @cached
+            def test_method(self, size):
+                self.counter += 1
+                return TeamList([{"school": "Duke"}] * size)
+        
+        api = TestAPI()
+        
+        api.test_method(10)
+        api.test_method(CACHE_MAX_VALUE_ITEMS + 1)
+        api.test_method(CACHE_MAX_VALUE_ITEMS + 1)
+        
+        assert api.counter == 3
+        assert list(api.client.cache) == [(TestAPI.test_method.__qualname__, (10,))]
+    
+    def test_cached_decorator_from_threads(self):
+        """Test cached decorator shares one cache between threads."""
+        class TestAPI:
+            def __init__(self):
+                self.client = SimpleNamespace(use_cache=True, cache=create_cache(maxsize=8, ttl=0.001))
+            
+            @cached
+            def test_method(self, arg1):
+                return arg1
+        
+        api = TestAPI()
+        
+        # Constant eviction and expiry relink the cache on every call
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(api.test_method, [i % 32 for i in range(20000)]))
+        
+        assert results == [i % 32 for i in range(20000)]
+        assert len(api.client.cache) <= 8
+    
     def test_cached_decorator_with_cache_disabled(self):
         """Test cached decorator with cache disabled."""
         # Create a mock class with cache disabled
         class TestAPI:
             def __init__(self):
-                self.client = MagicMock()
-                self.client.use_cache = False
+                self.client = SimpleNamespace(use_cache=False, cache=None)
                 self.counter = 0
             
             @cached
@@ -121,9 +285,7 @@ class TestCache:
         # Create a mock class with a short TTL cache
         class TestAPI:
             def __init__(self):
-                self.client = MagicMock()
-                self.client.use_cache = True
-                self.client.cache = create_cache(ttl=0.1)  # 100ms TTL for testing
+                self.client = SimpleNamespace(use_cache=True, cache=create_cache(ttl=0.1))  # 100ms TTL for testing
                 self.counter = 0
             
             @cached
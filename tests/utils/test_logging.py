@@ -55,17 +55,46 @@ class TestLogging:
             logger = setup_logger(log_file=log_file)
             
             assert len(logger.handlers) == 2
-            assert any(isinstance(handler, logging.FileHandler) for handler in logger.handlers)
+            file_handler = logger.handlers[-1]
+            assert isinstance(file_handler.target, logging.FileHandler)
             
-            # Test writing to log file
+            # Test writing to log file once the buffer is flushed
             test_message = "Test log message"
             logger.info(test_message)
+            file_handler.flush()
             
             with open(log_file, 'r') as f:
                 content = f.read()
                 assert test_message in content
         finally:
-            # Clean up the temporary file
+            # Close the file handler before removing the file
+            file_handler.target.close()
+            os.unlink(log_file)
+    
+    def test_setup_logger_reuses_handlers(self):
+        """Test repeated setup_logger calls reuse handlers for the same targets."""
+        with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as temp_file:
+            log_file = temp_file.name
+        
+        try:
+            stream = StringIO()
+            logger = setup_logger(name="reuse_logger", log_file=log_file, stream=stream)
+            handlers = list(logger.handlers)
+            
+            # Same targets keep the same handlers with the new format
+            logger = setup_logger(name="reuse_logger", log_format="%(message)s", log_file=log_file, stream=stream)
+            assert logger.handlers == handlers
+            assert logger.handlers[0].formatter._fmt == "%(message)s"
+            
+            # Dropping the log file closes its handler
+            file_handler = handlers[1].target
+            logger = setup_logger(name="reuse_logger", stream=stream)
+            assert logger.handlers == handlers[:1]
+            assert file_handler.stream is None
+        finally:
+            # Close any file handler left open before removing the file
+            for handler in logging.getLogger("reuse_logger").handlers:
+                handler.close()
             os.unlink(log_file)
     
     def test_setup_logger_with_custom_stream(self):
@@ -74,10 +103,10 @@ class TestLogging:
         logger = setup_logger(stream=stream)
         
         test_message = "Test log message"
-        logger.info(test_message)
+        logger.info("%s from %s", test_message, "stream test")
         
         stream_content = stream.getvalue()
-        assert test_message in stream_content
+        assert f"{test_message} from stream test" in stream_content
     
     def test_get_logger(self):
         """Test get_logger function."""
@@ -47,7 +47,9 @@ class TestValidation:
             "01/01/2023",
             "2023/01/01",
             "not a date",
-            "2023-13-01"  # Invalid month
+            "2023-13-01",  # Invalid month
+            "2023-02-30",  # Invalid day
+            "2023-01-01T25:00:00"  # Invalid hour
         ]
         for date in invalid_dates:
             with pytest.raises(CBBDValidationError):
@@ -68,4 +70,7 @@ class TestValidation:
             validate_season(2200)  # Too far in future
         
         with pytest.raises(CBBDValidationError):
-            validate_season("not a season") 
\ No newline at end of file
+            validate_season("not a season")
+        
+        with pytest.raises(CBBDValidationError):
+            validate_season(None) 
\ No newline at end of file